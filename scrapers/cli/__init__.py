@@ -1,15 +1,81 @@
-"""CLI commands for scrapers."""
-
-from scrapers.cli.scrape_elo import main as scrape_elo
-from scrapers.cli.scrape_fifa import main as scrape_fifa
-from scrapers.cli.scrape_groups import scrape_groups
-from scrapers.cli.merge_data import merge_data
-from scrapers.cli.validate import validate
-
-__all__ = [
-    "scrape_elo",
-    "scrape_fifa",
-    "scrape_groups",
-    "merge_data",
-    "validate",
-]
+"""CLI commands for scrapers.
+
+Commands are resolved lazily so that importing this package (or running a
+single subcommand) doesn't pay the import cost of every scraper's
+dependencies.
+"""
+
+import importlib
+
+import click
+
+# Attribute name in this module -> "module:attribute" command spec.
+_COMMANDS = {
+    "scrape_elo": "scrapers.cli.scrape_elo:main",
+    "scrape_fifa": "scrapers.cli.scrape_fifa:main",
+    "scrape_groups": "scrapers.cli.scrape_groups:scrape_groups",
+    "scrape_schedule": "scrapers.cli.scrape_schedule:main",
+    "scrape_sofascore": "scrapers.cli.scrape_sofascore:main",
+    "scrape_transfermarkt": "scrapers.cli.scrape_transfermarkt:scrape_transfermarkt",
+    "scrape_results": "scrapers.cli.scrape_results:main",
+    "merge_data": "scrapers.cli.merge_data:merge_data",
+    "validate": "scrapers.cli.validate:validate",
+}
+
+__all__ = [*_COMMANDS, "cli"]
+
+
+def _load(spec: str) -> click.Command:
+    """Import a command from its "module:attribute" spec."""
+    module_name, attr = spec.split(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def __getattr__(name: str) -> click.Command:
+    """Resolve re-exported CLI commands on first access (PEP 562)."""
+    try:
+        spec = _COMMANDS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    command = _load(spec)
+    globals()[name] = command
+    return command
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use."""
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: dict[str, str] | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(self.lazy_subcommands)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        spec = self.lazy_subcommands.get(cmd_name)
+        if spec is None:
+            return None
+        return _load(spec)
+
+
+cli = LazyGroup(
+    name="scrapers",
+    help="World Cup 2026 data scrapers.",
+    lazy_subcommands={
+        "elo": _COMMANDS["scrape_elo"],
+        "fifa": _COMMANDS["scrape_fifa"],
+        "groups": _COMMANDS["scrape_groups"],
+        "schedule": _COMMANDS["scrape_schedule"],
+        "sofascore": _COMMANDS["scrape_sofascore"],
+        "transfermarkt": _COMMANDS["scrape_transfermarkt"],
+        "results": _COMMANDS["scrape_results"],
+        "merge": _COMMANDS["merge_data"],
+        "validate": _COMMANDS["validate"],
+    },
+)
@@ -0,0 +1,6 @@
+"""Entry point for `python -m scrapers.cli`."""
+
+from scrapers.cli import cli
+
+if __name__ == "__main__":
+    cli()
@@ -1,7 +1,7 @@
 """CLI command to scrape ELO ratings."""
 
-import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import click
@@ -12,6 +12,7 @@ from rich.table import Table
 from ..config.settings import OUTPUT_DIR
 from ..sources.base import ScraperError
 from ..sources.elo_scraper import EloScraper
+from ..utils import jsonio
 from ..utils.logging_config import setup_logging
 
 
@@ -23,9 +24,18 @@ TEAM_MAPPING_FILE = CONFIG_DIR / "team_mapping.json"
 console = Console()
 
 
+@lru_cache(maxsize=4)
+def _parse_team_mapping(path: str, mtime: float) -> dict:
+    """Parse a team mapping file, cached on (path, mtime)."""
+    return jsonio.loads(Path(path).read_bytes())
+
+
 def load_team_mapping() -> dict:
     """Load team mapping from config file.
 
+    The parsed mapping is memoized per (path, mtime), so repeated calls
+    within one process skip the re-parse until the file changes on disk.
+
     Returns:
         Dictionary containing team mapping data.
 
@@ -38,54 +48,36 @@ def load_team_mapping() -> dict:
         )
 
     try:
-        with open(TEAM_MAPPING_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        return _parse_team_mapping(
+            str(TEAM_MAPPING_FILE), TEAM_MAPPING_FILE.stat().st_mtime
+        )
+    except jsonio.JSONDecodeError as e:
         raise click.ClickException(f"Invalid JSON in team mapping file: {e}")
 
 
-def get_elo_team_names(team_mapping: dict) -> list[str]:
-    """Get list of team names for ELO scraping.
+def build_elo_tables(team_mapping: dict) -> tuple[list[str], dict[str, str]]:
+    """Build the ELO scrape list and ELO-to-canonical map in one pass.
 
     Args:
         team_mapping: The loaded team mapping dictionary.
 
     Returns:
-        List of team names to use when querying international-football.net.
+        Tuple of (team names to query international-football.net with,
+        mapping from ELO site names to canonical names). TBD teams are
+        skipped in both.
     """
-    team_names = []
+    team_names: list[str] = []
+    elo_to_canonical: dict[str, str] = {}
 
     for team in team_mapping.get("teams", []):
-        aliases = team.get("aliases", {})
-        elo_name = aliases.get("elo")
+        elo_name = team.get("aliases", {}).get("elo")
 
         # Skip TBD teams
         if elo_name and elo_name != "TBD":
             team_names.append(elo_name)
+            elo_to_canonical[elo_name] = team.get("canonical_name", "")
 
-    return team_names
-
-
-def build_elo_to_canonical_map(team_mapping: dict) -> dict[str, str]:
-    """Build a mapping from ELO names to canonical names.
-
-    Args:
-        team_mapping: The loaded team mapping dictionary.
-
-    Returns:
-        Dictionary mapping ELO site names to canonical names.
-    """
-    elo_to_canonical = {}
-
-    for team in team_mapping.get("teams", []):
-        canonical_name = team.get("canonical_name", "")
-        aliases = team.get("aliases", {})
-        elo_name = aliases.get("elo", "")
-
-        if elo_name and elo_name != "TBD":
-            elo_to_canonical[elo_name] = canonical_name
-
-    return elo_to_canonical
+    return team_names, elo_to_canonical
 
 
 @click.command()
@@ -109,7 +101,14 @@ def build_elo_to_canonical_map(team_mapping: dict) -> dict[str, str]:
     default=None,
     help="Scrape only a specific team by name.",
 )
-def main(output_dir: Path, verbose: bool, team: str | None) -> None:
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(1, 16),
+    default=4,
+    help="Number of parallel fetch threads.",
+)
+def main(output_dir: Path, verbose: bool, team: str | None, workers: int) -> None:
     """Scrape ELO ratings from international-football.net.
 
     Fetches the latest ELO ratings for national football teams and saves
@@ -125,8 +124,7 @@ def main(output_dir: Path, verbose: bool, team: str | None) -> None:
     # Load team mapping
     console.print("[dim]Loading team mapping...[/dim]")
     team_mapping = load_team_mapping()
-    team_names = get_elo_team_names(team_mapping)
-    elo_to_canonical = build_elo_to_canonical_map(team_mapping)
+    team_names, elo_to_canonical = build_elo_tables(team_mapping)
     console.print(f"[green]Loaded {len(team_names)} teams to scrape[/green]")
 
     # Filter to single team if specified
@@ -146,11 +144,13 @@ def main(output_dir: Path, verbose: bool, team: str | None) -> None:
     # Run scraper
     console.print()
     console.print(f"[dim]Fetching ELO ratings for {len(team_names)} teams...[/dim]")
-    console.print("[dim](Rate limited: 1 second between requests)[/dim]")
+    console.print(
+        f"[dim]({workers} threads, rate limited to one request per second overall)[/dim]"
+    )
     console.print()
 
     try:
-        scraper = EloScraper(output_dir=output_dir)
+        scraper = EloScraper(output_dir=output_dir, max_workers=workers)
         data = scraper.scrape(team_names=team_names)
     except ScraperError as e:
         console.print(f"[bold red]Scraper error:[/bold red] {e}")
@@ -200,6 +200,7 @@ def main(output_dir: Path, verbose: bool, team: str | None) -> None:
     console.print()
     console.print("[bold]Summary:[/bold]")
     console.print(f"  Teams scraped: {len(canonical_teams)}")
+    console.print(f"  Cache hits: {scraper.cache_hits}/{len(canonical_teams)}")
     console.print(f"  Source: {data.get('source', 'unknown')}")
     console.print(f"  Scraped at: {data.get('scraped_at', 'unknown')}")
 
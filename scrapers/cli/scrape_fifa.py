@@ -1,7 +1,9 @@
 """CLI command to scrape FIFA world rankings."""
 
-import json
 import sys
+from functools import lru_cache
+from heapq import nsmallest
+from operator import itemgetter
 from pathlib import Path
 
 import click
@@ -12,30 +14,38 @@ from rich.table import Table
 from scrapers.config.settings import OUTPUT_DIR, DATA_DIR
 from scrapers.sources.base import ScraperError
 from scrapers.sources.fifa_scraper import FifaScraper
+from scrapers.utils import jsonio
 from scrapers.utils.logging_config import setup_logging
 
 
 console = Console()
 
 
-def load_team_mapping() -> dict[str, str]:
-    """Load team name mapping from data directory.
+@lru_cache(maxsize=4)
+def _parse_teams_file(path: str, mtime: float) -> dict:
+    """Parse a teams.json file, cached on (path, mtime)."""
+    return jsonio.loads(Path(path).read_bytes())
+
+
+def load_known_teams() -> set[str]:
+    """Load the set of known team names from the data directory.
+
+    The parsed file is memoized per (path, mtime), so repeated calls within
+    one process skip the re-parse until the file changes on disk.
 
     Returns:
-        Dict mapping FIFA names to internal names, or empty dict if not found.
+        Set of team names for comparison, or empty set if not found.
     """
     # Try to load from teams.json to get known team names
     teams_file = DATA_DIR / "teams.json"
     if teams_file.exists():
         try:
-            with open(teams_file, encoding="utf-8") as f:
-                data = json.load(f)
-                # Return dict of name -> name (for comparison)
-                return {team["name"]: team["name"] for team in data.get("teams", [])}
-        except (json.JSONDecodeError, KeyError) as e:
+            data = _parse_teams_file(str(teams_file), teams_file.stat().st_mtime)
+            return {team["name"] for team in data.get("teams", [])}
+        except (jsonio.JSONDecodeError, KeyError) as e:
             console.print(f"[yellow]Warning: Could not load team mapping: {e}[/yellow]")
 
-    return {}
+    return set()
 
 
 def display_rankings(rankings: dict[str, int], known_teams: set[str]) -> None:
@@ -50,12 +60,12 @@ def display_rankings(rankings: dict[str, int], known_teams: set[str]) -> None:
     table.add_column("Team", style="bold")
     table.add_column("Status", justify="center")
 
-    # Sort by rank
-    sorted_rankings = sorted(rankings.items(), key=lambda x: x[1])
+    # Show top 50 teams; nsmallest avoids a full sort of the rankings
+    top_teams = nsmallest(50, rankings.items(), key=itemgetter(1))
 
-    # Show top 50 teams
-    for team_name, rank in sorted_rankings[:50]:
-        if team_name in known_teams:
+    known = known_teams
+    for team_name, rank in top_teams:
+        if team_name in known:
             status = "[green]In Data[/green]"
         else:
             status = "[dim]-[/dim]"
@@ -125,9 +135,8 @@ def main(output: Path | None, quiet: bool, verbose: bool) -> None:
             )
         )
 
-    # Load team mapping for reference
-    team_mapping = load_team_mapping()
-    known_teams = set(team_mapping.keys())
+    # Load known team names for reference
+    known_teams = load_known_teams()
 
     if not quiet and known_teams:
         console.print(f"[dim]Loaded {len(known_teams)} teams from data file[/dim]\n")
@@ -142,8 +151,7 @@ def main(output: Path | None, quiet: bool, verbose: bool) -> None:
         # Save to file
         if output:
             # Custom output path - save directly
-            with open(output, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            output.write_bytes(jsonio.dumps(data))
             output_path = output
         else:
             output_path = scraper.save(data)
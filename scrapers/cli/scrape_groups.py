@@ -1,13 +1,15 @@
 """CLI command for scraping World Cup 2026 group assignments."""
 
+import hashlib
 import json
+import os
+import re
 import sys
+import time
 from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from scrapers.config.settings import OUTPUT_DIR
 from scrapers.sources.base import ScraperError
@@ -15,8 +17,19 @@ from scrapers.sources.groups_scraper import GroupsScraper
 from scrapers.utils.logging_config import setup_logging
 
 
+# Path to team mapping config
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+TEAM_MAPPING_FILE = CONFIG_DIR / "team_mapping.json"
+
+# How long a cached --verify result stays valid (seconds)
+VERIFY_CACHE_TTL = 3600
+
+
 console = Console()
 
+# Matches placeholder entries like "TBD" or "UEFA Playoff A"
+_PLACEHOLDER_RE = re.compile(r"TBD|Playoff")
+
 
 @click.command()
 @click.option(
@@ -62,16 +75,21 @@ def scrape_groups(
     setup_logging(level=logging.DEBUG if debug else logging.INFO)
 
     output_dir = output.parent
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    scraper = GroupsScraper(output_dir)
 
+    # Verification never writes output, so dispatch before any setup
     if verify:
-        _run_verification(scraper, quiet)
+        _run_verification(GroupsScraper(output_dir), quiet)
         return
 
+    if not output_dir.exists():
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    scraper = GroupsScraper(output_dir)
+
     try:
         if not quiet:
+            from rich.panel import Panel
+
             console.print(
                 Panel(
                     "[bold blue]World Cup 2026 Groups Scraper[/bold blue]\n"
@@ -108,6 +126,26 @@ def _display_groups(data: dict) -> None:
     groups = data.get("groups", {})
     meta = data.get("meta", {})
 
+    # Piped output: skip Rich rendering entirely and emit plain lines
+    if not console.is_terminal:
+        out = sys.stdout
+        for letter in "ABCDEFGHIJKL":
+            teams = groups.get(letter, ["?"] * 4)
+            out.write(f"{letter}\t" + "\t".join(teams) + "\n")
+        out.write(f"source\t{data.get('source', 'unknown')}\n")
+        out.write(f"scraped_at\t{data.get('scraped_at', 'unknown')}\n")
+        out.write(
+            f"total_teams\t{meta.get('total_teams', 48)}\t"
+            f"tbd_spots\t{meta.get('tbd_spots', 0)}\n"
+        )
+        return
+
+    # Deferred: only interactive display paths pay for these imports
+    from rich.console import Group
+    from rich.style import Style
+    from rich.table import Table
+    from rich.text import Text
+
     # Create main groups table
     table = Table(
         title="[bold]FIFA World Cup 2026 Groups[/bold]",
@@ -121,28 +159,76 @@ def _display_groups(data: dict) -> None:
     table.add_column("Team 3", width=25)
     table.add_column("Team 4", width=25)
 
+    # One shared Style beats re-parsing "[dim italic]...[/dim italic]"
+    # markup for every placeholder cell
+    placeholder_style = Style(dim=True, italic=True)
+    is_placeholder = _PLACEHOLDER_RE.search
     for letter in "ABCDEFGHIJKL":
         teams = groups.get(letter, ["?"] * 4)
-        formatted_teams = []
-        for team in teams:
-            if "TBD" in team or "Playoff" in team:
-                formatted_teams.append(f"[dim italic]{team}[/dim italic]")
-            else:
-                formatted_teams.append(team)
+        formatted_teams = [
+            Text(team, style=placeholder_style) if is_placeholder(team) else team
+            for team in teams
+        ]
 
         table.add_row(f"Group {letter}", *formatted_teams)
 
-    console.print()
-    console.print(table)
-
-    # Display metadata
-    console.print()
-    console.print(f"[bold]Source:[/bold] {data.get('source', 'unknown')}")
-    console.print(f"[bold]Scraped at:[/bold] {data.get('scraped_at', 'unknown')}")
-    console.print(
+    # Batch the table and metadata block into a single renderable; each
+    # console.print repaints separately, which adds up when output is piped.
+    metadata = Text.from_markup(
+        f"[bold]Source:[/bold] {data.get('source', 'unknown')}\n"
+        f"[bold]Scraped at:[/bold] {data.get('scraped_at', 'unknown')}\n"
         f"[bold]Total teams:[/bold] {meta.get('total_teams', 48)} "
         f"([dim]{meta.get('tbd_spots', 0)} TBD playoff spots[/dim])"
     )
+    console.print(Group(Text(), table, Text(), metadata))
+
+
+def _cached_verification(scraper: GroupsScraper) -> dict:
+    """Run verify_against_mapping() with an on-disk memo.
+
+    The FIFA-site comparison is re-scraped at most once per
+    VERIFY_CACHE_TTL for an unchanged team_mapping.json; the cached
+    result is keyed by the mapping file's SHA-256, so any edit to the
+    mapping invalidates it immediately.
+
+    Args:
+        scraper: GroupsScraper instance.
+
+    Returns:
+        Verification result dictionary.
+    """
+    try:
+        mapping_hash = hashlib.sha256(TEAM_MAPPING_FILE.read_bytes()).hexdigest()
+    except OSError:
+        # No mapping file to key on - verify fresh every time
+        return scraper.verify_against_mapping()
+
+    cache_path = scraper.output_dir / ".verify_cache.json"
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if (
+            cached["mapping_hash"] == mapping_hash
+            and time.time() - cached["verified_at"] < VERIFY_CACHE_TTL
+        ):
+            return cached["result"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    result = scraper.verify_against_mapping()
+
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    tmp_path.write_text(
+        json.dumps(
+            {
+                "mapping_hash": mapping_hash,
+                "verified_at": time.time(),
+                "result": result,
+            }
+        )
+    )
+    os.replace(tmp_path, cache_path)
+
+    return result
 
 
 def _run_verification(scraper: GroupsScraper, quiet: bool) -> None:
@@ -153,6 +239,8 @@ def _run_verification(scraper: GroupsScraper, quiet: bool) -> None:
         quiet: Whether to suppress detailed output.
     """
     if not quiet:
+        from rich.panel import Panel
+
         console.print(
             Panel(
                 "[bold blue]Verification Mode[/bold blue]\n"
@@ -161,7 +249,7 @@ def _run_verification(scraper: GroupsScraper, quiet: bool) -> None:
             )
         )
 
-    result = scraper.verify_against_mapping()
+    result = _cached_verification(scraper)
 
     if not result["scraped_available"]:
         console.print(
@@ -189,6 +277,8 @@ def _run_verification(scraper: GroupsScraper, quiet: bool) -> None:
             "Differences found between FIFA website and team_mapping.json:"
         )
 
+        from rich.table import Table
+
         diff_table = Table(show_header=True, header_style="bold")
         diff_table.add_column("Group")
         diff_table.add_column("FIFA Website")
@@ -1,11 +1,11 @@
 """CLI command to generate FIFA World Cup 2026 schedule."""
 
 import sys
+from collections import Counter
 from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.table import Table
 
 from ..config.settings import OUTPUT_DIR
 from ..sources.base import ScraperError
@@ -75,31 +75,61 @@ def main(output_dir: Path, verbose: bool, copy_to_web: bool) -> None:
         if web_data_dir.exists():
             import shutil
             web_output = web_data_dir / "schedule.json"
-            shutil.copy(output_path, web_output)
+            # copyfile skips the stat/chmod pair that shutil.copy does
+            shutil.copyfile(output_path, web_output)
             console.print(f"[bold green]Copied to:[/bold green] {web_output}")
         else:
             console.print(f"[yellow]Warning: Web data directory not found: {web_data_dir}[/yellow]")
 
     # Display summary
-    matches = data.get("matches", [])
-    console.print()
-    console.print("[bold]Summary:[/bold]")
-    console.print(f"  Total matches: {len(matches)}")
-
-    # Count by round
-    round_counts: dict[str, int] = {}
-    for match in matches:
-        round_type = match.get("round", "unknown")
-        round_counts[round_type] = round_counts.get(round_type, 0) + 1
 
-    console.print("  Matches by round:")
-    for round_type, count in sorted(round_counts.items()):
-        console.print(f"    {round_type}: {count}")
+    # Count by round in a single pass
+    matches = data.get("matches", [])
+    round_counts = Counter(match.get("round", "unknown") for match in matches)
+
+    # Emit the whole summary block with one print; per-line console.print
+    # calls each pay full render overhead.
+    summary_lines = [
+        "",
+        "[bold]Summary:[/bold]",
+        f"  Total matches: {len(matches)}",
+        "  Matches by round:",
+    ]
+    summary_lines.extend(
+        f"    {round_type}: {count}"
+        for round_type, count in sorted(round_counts.items())
+    )
+    console.print("\n".join(summary_lines))
 
     # Verbose output - show match table
-    if verbose:
+    if verbose and not console.is_terminal:
+        # Piped output: one plain tab-separated line per match instead of
+        # Rich tables
+        out = sys.stdout
+        for match in matches:
+            out.write(
+                f"{match.get('matchNumber', '')}\t{match.get('date', '')}\t"
+                f"{match.get('time', '')}\t{match.get('round', '')}\t"
+                f"{match.get('venueId', '')}\t{match.get('groupId', '')}\n"
+            )
+    elif verbose:
+        # Deferred: only the verbose path pays for table rendering imports
+        from rich.console import Group
+        from rich.table import Table
+        from rich.text import Text
+
         console.print()
 
+        # Partition matches in one pass instead of filtering the list twice
+        group_matches: list[dict] = []
+        knockout_matches: list[dict] = []
+        for match in matches:
+            (
+                group_matches
+                if match.get("round") == "group_stage"
+                else knockout_matches
+            ).append(match)
+
         # Group stage summary
         table = Table(title="Group Stage Matches (first 12)")
         table.add_column("Match", style="cyan", width=6)
@@ -109,21 +139,21 @@ def main(output_dir: Path, verbose: bool, copy_to_web: bool) -> None:
         table.add_column("Group", width=6)
         table.add_column("Matchup", width=20)
 
-        group_matches = [m for m in matches if m.get("round") == "group_stage"][:12]
-        for match in group_matches:
+        matchup = "{} vs {}".format
+        for match in group_matches[:12]:
             table.add_row(
                 str(match.get("matchNumber", "")),
                 match.get("date", ""),
                 match.get("time", ""),
                 match.get("venueId", ""),
                 match.get("groupId", ""),
-                f"{match.get('homePlaceholder', '?')} vs {match.get('awayPlaceholder', '?')}",
+                matchup(
+                    match.get("homePlaceholder", "?"),
+                    match.get("awayPlaceholder", "?"),
+                ),
             )
 
-        console.print(table)
-
         # Knockout summary
-        console.print()
         table2 = Table(title="Knockout Stage Matches")
         table2.add_column("Match", style="cyan", width=6)
         table2.add_column("Date", width=12)
@@ -132,7 +162,6 @@ def main(output_dir: Path, verbose: bool, copy_to_web: bool) -> None:
         table2.add_column("Venue", width=20)
         table2.add_column("Slot", width=5)
 
-        knockout_matches = [m for m in matches if m.get("round") != "group_stage"]
         for match in knockout_matches:
             table2.add_row(
                 str(match.get("matchNumber", "")),
@@ -143,7 +172,8 @@ def main(output_dir: Path, verbose: bool, copy_to_web: bool) -> None:
                 str(match.get("knockoutSlot", "")),
             )
 
-        console.print(table2)
+        # Print both tables in one pass
+        console.print(Group(table, Text(), table2))
 
     console.print()
     console.print(f"[dim]Generated at: {data.get('lastUpdated', 'unknown')}[/dim]")
@@ -1,7 +1,10 @@
 """CLI command to scrape Sofascore form data."""
 
-import json
 import sys
+from functools import lru_cache
+from heapq import nlargest
+from math import fsum
+from operator import itemgetter
 from pathlib import Path
 
 import click
@@ -9,8 +12,7 @@ from rich.console import Console
 from rich.table import Table
 
 from ..config.settings import OUTPUT_DIR
-from ..sources.base import ScraperError
-from ..sources.sofascore_scraper import SofascoreScraper
+from ..utils import jsonio
 from ..utils.logging_config import setup_logging
 
 
@@ -22,9 +24,18 @@ TEAM_MAPPING_FILE = CONFIG_DIR / "team_mapping.json"
 console = Console()
 
 
+@lru_cache(maxsize=4)
+def _parse_team_mapping(path: str, mtime: float) -> dict:
+    """Parse a team mapping file, cached on (path, mtime)."""
+    return jsonio.loads(Path(path).read_bytes())
+
+
 def load_team_mapping() -> dict:
     """Load team mapping from config file.
 
+    The parsed mapping is memoized per (path, mtime), so repeated calls
+    within one process skip the re-parse until the file changes on disk.
+
     Returns:
         Dictionary containing team mapping data.
 
@@ -37,9 +48,10 @@ def load_team_mapping() -> dict:
         )
 
     try:
-        with open(TEAM_MAPPING_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        return _parse_team_mapping(
+            str(TEAM_MAPPING_FILE), TEAM_MAPPING_FILE.stat().st_mtime
+        )
+    except jsonio.JSONDecodeError as e:
         raise click.ClickException(f"Invalid JSON in team mapping file: {e}")
 
 
@@ -87,7 +99,25 @@ def get_sofascore_team_ids(team_mapping: dict) -> dict[str, int]:
     is_flag=True,
     help="Enable verbose output.",
 )
-def main(output_dir: Path, team: str | None, verbose: bool) -> None:
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(1, 16),
+    default=4,
+    help="Number of parallel fetch threads.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Bypass the on-disk response cache and fetch fresh data.",
+)
+def main(
+    output_dir: Path,
+    team: str | None,
+    verbose: bool,
+    workers: int,
+    no_cache: bool,
+) -> None:
     """Scrape team form data from Sofascore.
 
     Fetches recent match results for national football teams and calculates
@@ -114,26 +144,33 @@ def main(output_dir: Path, team: str | None, verbose: bool) -> None:
 
     # Filter to single team if specified
     if team:
-        if team in team_ids:
-            team_ids = {team: team_ids[team]}
-        else:
-            # Try case-insensitive match
-            for canonical, sofascore_id in list(team_ids.items()):
-                if canonical.lower() == team.lower():
-                    team_ids = {canonical: sofascore_id}
-                    break
-            else:
-                raise click.ClickException(f"Team not found in mapping: {team}")
-        console.print(f"[yellow]Scraping single team: {list(team_ids.keys())[0]}[/yellow]")
+        canonical = team if team in team_ids else None
+        if canonical is None:
+            # Case-insensitive match via a one-shot casefolded index
+            by_casefold = {name.casefold(): name for name in team_ids}
+            canonical = by_casefold.get(team.casefold())
+        if canonical is None:
+            raise click.ClickException(f"Team not found in mapping: {team}")
+        team_ids = {canonical: team_ids[canonical]}
+        console.print(f"[yellow]Scraping single team: {canonical}[/yellow]")
 
     # Run scraper
     console.print()
     console.print(f"[dim]Fetching form data for {len(team_ids)} teams...[/dim]")
-    console.print("[dim](Rate limited: 2 seconds between requests)[/dim]")
+    console.print(
+        f"[dim]({workers} threads, rate limited to one request per 2 seconds overall)[/dim]"
+    )
     console.print()
 
+    # Deferred: importing the scraper pulls in cloudscraper, which --help
+    # and argument-validation failures shouldn't pay for
+    from ..sources.base import ScraperError
+    from ..sources.sofascore_scraper import SofascoreScraper
+
     try:
-        scraper = SofascoreScraper(output_dir=output_dir)
+        scraper = SofascoreScraper(
+            output_dir=output_dir, max_workers=workers, use_cache=not no_cache
+        )
         data = scraper.scrape(team_ids=team_ids)
     except ScraperError as e:
         console.print(f"[bold red]Scraper error:[/bold red] {e}")
@@ -153,40 +190,55 @@ def main(output_dir: Path, team: str | None, verbose: bool) -> None:
 
     if teams_data:
         console.print()
-        table = Table(title="Team Form Scores")
-        table.add_column("Team", style="cyan")
-        table.add_column("Form", justify="right", style="green")
-        table.add_column("Record", justify="center")
-        table.add_column("Results", justify="left", style="dim")
-
-        # Sort by form score descending
-        sorted_teams = sorted(
-            teams_data.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
 
-        display_count = 20 if not verbose else len(sorted_teams)
-        for team_name, form_score in sorted_teams[:display_count]:
-            info = matches_info.get(team_name, {})
-            record = f"{info.get('wins', 0)}W-{info.get('draws', 0)}D-{info.get('losses', 0)}L"
-            results = info.get("results", "")
-            table.add_row(team_name, f"{form_score:.2f}", record, results)
-
-        console.print(table)
-
-        if len(sorted_teams) > display_count:
-            console.print(f"[dim]... and {len(sorted_teams) - display_count} more teams[/dim]")
+        # Sort by form score descending; the non-verbose view only shows the
+        # top 20, so nlargest skips a full sort there
+        if verbose:
+            sorted_teams = sorted(
+                teams_data.items(), key=itemgetter(1), reverse=True
+            )
+        else:
+            sorted_teams = nlargest(20, teams_data.items(), key=itemgetter(1))
+
+        if console.is_terminal:
+            table = Table(title="Team Form Scores")
+            table.add_column("Team", style="cyan")
+            table.add_column("Form", justify="right", style="green")
+            table.add_column("Record", justify="center")
+            table.add_column("Results", justify="left", style="dim")
+
+            for team_name, form_score in sorted_teams:
+                info = matches_info.get(team_name, {})
+                record = f"{info.get('wins', 0)}W-{info.get('draws', 0)}D-{info.get('losses', 0)}L"
+                results = info.get("results", "")
+                table.add_row(team_name, f"{form_score:.2f}", record, results)
+
+            console.print(table)
+        else:
+            # Piped output: plain tab-separated lines instead of a Rich table
+            out = sys.stdout
+            for team_name, form_score in sorted_teams:
+                info = matches_info.get(team_name, {})
+                record = f"{info.get('wins', 0)}W-{info.get('draws', 0)}D-{info.get('losses', 0)}L"
+                out.write(
+                    f"{team_name}\t{form_score:.2f}\t{record}\t"
+                    f"{info.get('results', '')}\n"
+                )
+
+        remaining = len(teams_data) - len(sorted_teams)
+        if remaining > 0:
+            console.print(f"[dim]... and {remaining} more teams[/dim]")
 
     # Summary
     console.print()
     console.print("[bold]Summary:[/bold]")
     console.print(f"  Teams scraped: {len(teams_data)}")
+    console.print(f"  Cache hits: {scraper.cache_hits}/{len(teams_data)}")
     console.print(f"  Source: {data.get('source', 'unknown')}")
     console.print(f"  Scraped at: {data.get('scraped_at', 'unknown')}")
 
     if teams_data:
-        avg_form = sum(teams_data.values()) / len(teams_data)
+        avg_form = fsum(teams_data.values()) / len(teams_data)
         console.print(f"  Average form: {avg_form:.2f}")
 
 
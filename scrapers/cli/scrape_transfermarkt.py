@@ -1,18 +1,20 @@
 """CLI command to scrape Transfermarkt market values."""
 
-import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
 from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.table import Table
 
-from scrapers.sources.transfermarkt_scraper import TransfermarktScraper
-from scrapers.sources.base import ScraperError
 from scrapers.config.settings import OUTPUT_DIR
+from scrapers.utils import jsonio
 
 
 # Path to team mapping config
@@ -22,9 +24,18 @@ TEAM_MAPPING_FILE = CONFIG_DIR / "team_mapping.json"
 console = Console()
 
 
+@lru_cache(maxsize=4)
+def _parse_team_mapping(path: str, mtime: float) -> dict:
+    """Parse a team mapping file, cached on (path, mtime)."""
+    return jsonio.loads(Path(path).read_bytes())
+
+
 def load_team_mapping() -> dict:
     """Load team mapping from config file.
 
+    The parsed mapping is memoized per (path, mtime), so repeated calls
+    within one process skip the re-parse until the file changes on disk.
+
     Returns:
         The team mapping dictionary.
 
@@ -36,8 +47,9 @@ def load_team_mapping() -> dict:
             f"Team mapping file not found: {TEAM_MAPPING_FILE}"
         )
 
-    with open(TEAM_MAPPING_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _parse_team_mapping(
+        str(TEAM_MAPPING_FILE), TEAM_MAPPING_FILE.stat().st_mtime
+    )
 
 
 def get_scrapeable_teams(team_mapping: dict) -> list[dict]:
@@ -82,15 +94,34 @@ def get_scrapeable_teams(team_mapping: dict) -> list[dict]:
     is_flag=True,
     help="Show teams that would be scraped without making requests",
 )
-def scrape_transfermarkt(output: str | None, team: str | None, dry_run: bool) -> None:
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(1, 16),
+    default=4,
+    help="Number of parallel scraping threads",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Bypass the on-disk response cache and fetch fresh data",
+)
+def scrape_transfermarkt(
+    output: str | None,
+    team: str | None,
+    dry_run: bool,
+    workers: int,
+    no_cache: bool,
+) -> None:
     """Scrape national team market values from Transfermarkt.
 
     This command fetches the total squad market value for each World Cup 2026
     team from transfermarkt.us and saves the results to a JSON file.
 
     Note: Transfermarkt uses Cloudflare protection, so this scraper uses
-    cloudscraper to bypass it. A 2-second delay is enforced between requests
-    to be respectful to the server.
+    cloudscraper to bypass it. Teams are fetched in parallel, but a shared
+    rate limiter keeps the aggregate request spacing at 2 seconds to be
+    respectful to the server.
     """
     console.print("[bold blue]Transfermarkt Market Value Scraper[/bold blue]")
     console.print()
@@ -109,9 +140,11 @@ def scrape_transfermarkt(output: str | None, team: str | None, dry_run: bool) ->
     if not teams:
         raise click.ClickException("No teams with valid Transfermarkt data found")
 
-    # Filter to specific team if requested
+    # Filter to specific team if requested; casefold the needle once
+    # (casefold rather than lower for Unicode names like "Türkiye")
     if team:
-        teams = [t for t in teams if t["canonical_name"].lower() == team.lower()]
+        needle = team.casefold()
+        teams = [t for t in teams if t["canonical_name"].casefold() == needle]
         if not teams:
             raise click.ClickException(f"Team not found: {team}")
 
@@ -135,11 +168,28 @@ def scrape_transfermarkt(output: str | None, team: str | None, dry_run: bool) ->
         console.print(table)
         return
 
+    # Deferred: importing the scraper pulls in cloudscraper, which --help
+    # and --dry-run invocations shouldn't pay for
+    from scrapers.sources.base import ScraperError
+    from scrapers.sources.transfermarkt_scraper import TransfermarktScraper
+
     # Initialize scraper
     output_dir = Path(output).parent if output else OUTPUT_DIR
-    scraper = TransfermarktScraper(output_dir=output_dir)
-
-    # Scrape teams
+    scraper = TransfermarktScraper(
+        output_dir=output_dir, max_workers=workers, use_cache=not no_cache
+    )
+
+    # Deferred: only the real scraping path pays for rich.progress
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+    )
+
+    # Scrape teams in parallel; the scraper's shared rate limiter keeps the
+    # aggregate request rate unchanged.
     results: dict[str, float] = {}
     errors: list[str] = []
 
@@ -149,28 +199,50 @@ def scrape_transfermarkt(output: str | None, team: str | None, dry_run: bool) ->
         BarColumn(),
         TaskProgressColumn(),
         console=console,
+        # No live repaints when output is piped
+        disable=not console.is_terminal,
     ) as progress:
         task = progress.add_task("Scraping teams...", total=len(teams))
 
-        for team_data in teams:
-            canonical_name = team_data["canonical_name"]
-            tm_slug = team_data["aliases"]["transfermarkt"]
-            tm_id = team_data["aliases"]["transfermarkt_id"]
-
-            progress.update(task, description=f"Scraping {canonical_name}...")
+        # Size the pool to the pending work so --team runs don't spin up
+        # idle workers
+        with ThreadPoolExecutor(max_workers=min(len(teams), workers)) as executor:
+            futures = {
+                executor.submit(
+                    scraper.scrape_team,
+                    t["canonical_name"],
+                    t["aliases"]["transfermarkt"],
+                    t["aliases"]["transfermarkt_id"],
+                ): t["canonical_name"]
+                for t in teams
+            }
+
+            for future in as_completed(futures):
+                canonical_name = futures[future]
+                try:
+                    name, value = future.result()
+                    results[name] = value
+                except ScraperError as e:
+                    errors.append(f"{canonical_name}: {e}")
+                progress.advance(task)
 
-            try:
-                name, value = scraper.scrape_team(canonical_name, tm_slug, tm_id)
-                results[name] = value
-            except ScraperError as e:
-                errors.append(f"{canonical_name}: {e}")
-                console.print(f"[red]Error scraping {canonical_name}: {e}[/red]")
-                # Fail fast - stop on first error
-                raise click.ClickException(str(e))
+    console.print()
 
-            progress.advance(task)
+    # Collect all failures before bailing so parallel workers finish cleanly
+    if errors:
+        for error in errors:
+            console.print(f"[red]Error scraping {error}[/red]")
+        raise click.ClickException(
+            f"Failed to scrape {len(errors)} team(s); output not written"
+        )
 
-    console.print()
+    # Futures complete in arbitrary order; restore mapping order so the
+    # output file stays stable across runs.
+    results = {
+        t["canonical_name"]: results[t["canonical_name"]]
+        for t in teams
+        if t["canonical_name"] in results
+    }
 
     # Build output data
     output_data = {
@@ -184,30 +256,42 @@ def scrape_transfermarkt(output: str | None, team: str | None, dry_run: bool) ->
     output_path = Path(output) if output else OUTPUT_DIR / "transfermarkt_values.json"
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Save results
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    # Save results atomically: write a sibling tmp file, then rename over
+    # the target so a crash mid-write can't leave a truncated file behind.
+    tmp_path = output_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(jsonio.dumps(output_data))
+    os.replace(tmp_path, output_path)
 
     console.print(f"[green]Saved results to {output_path}[/green]")
     console.print()
 
-    # Show summary
-    table = Table(title="Market Values (Top 10)")
-    table.add_column("Team", style="cyan")
-    table.add_column("Value", style="green", justify="right")
-
-    # Sort by value descending and show top 10
-    sorted_teams = sorted(results.items(), key=lambda x: x[1], reverse=True)[:10]
-    for name, value in sorted_teams:
-        if value >= 1000:
-            value_str = f"{value / 1000:.2f}bn"
-        else:
-            value_str = f"{value:.2f}m"
-        table.add_row(name, value_str)
-
-    console.print(table)
+    # Show summary: top 10 by value; nlargest avoids a full sort
+    sorted_teams = nlargest(10, results.items(), key=itemgetter(1))
+
+    if console.is_terminal:
+        table = Table(title="Market Values (Top 10)")
+        table.add_column("Team", style="cyan")
+        table.add_column("Value", style="green", justify="right")
+
+        for name, value in sorted_teams:
+            if value >= 1000:
+                value_str = f"{value / 1000:.2f}bn"
+            else:
+                value_str = f"{value:.2f}m"
+            table.add_row(name, value_str)
+
+        console.print(table)
+    else:
+        # Piped output: plain tab-separated lines instead of a Rich table
+        out = sys.stdout
+        for name, value in sorted_teams:
+            value_str = f"{value / 1000:.2f}bn" if value >= 1000 else f"{value:.2f}m"
+            out.write(f"{name}\t{value_str}\n")
     console.print()
     console.print(f"[bold]Total teams scraped:[/bold] {len(results)}")
+    console.print(
+        f"[bold]Cache hits:[/bold] {scraper.cache_hits}/{len(results)}"
+    )
 
 
 if __name__ == "__main__":
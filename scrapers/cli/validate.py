@@ -1,28 +1,62 @@
 """CLI command to validate teams.json against the schema."""
 
-import json
+import hashlib
+import os
+import re
 import sys
 from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from scrapers.models.team import TournamentData
+from scrapers.utils import jsonio
 
 
 console = Console()
 
+# Built lazily by _get_tournament_adapter so importing this module (for
+# --help or argument errors) doesn't pay for pydantic. Every validation
+# run still builds it once, cache hit or not, because the result-cache
+# key hashes the model schema; what a hit skips is the validation pass
+# itself. Once built, the compiled pydantic-core validator is reused
+# across calls instead of being re-resolved per validation.
+_TOURNAMENT_ADAPTER = None
 
+# Fixed tournament-format constants, hoisted so no check rebuilds them.
+# The tuple keeps display order; the frozenset is for membership tests.
+_EXPECTED_GROUP_IDS = tuple("ABCDEFGHIJKL")
+_CONFEDERATION_ORDER = ("UEFA", "CONMEBOL", "CONCACAF", "CAF", "AFC", "OFC")
+_VALID_CONFEDERATIONS = frozenset(_CONFEDERATION_ORDER)
+
+# 3-letter uppercase FIFA code; one C-level fullmatch instead of the
+# len/isupper/isalpha triplet. Mirrors the Team.code pattern in models.
+_CODE_RE = re.compile(r"[A-Z]{3}")
+
+# On-disk memo for previously validated files, keyed by content hash
+_VALIDATE_CACHE_DIR = Path.home() / ".cache" / "wc_predictor" / "validate"
+
+
+def _get_tournament_adapter():
+    """Build (once) the TypeAdapter for TournamentData."""
+    global _TOURNAMENT_ADAPTER
+    if _TOURNAMENT_ADAPTER is None:
+        from pydantic import TypeAdapter
+
+        from scrapers.models.team import TournamentData
+
+        _TOURNAMENT_ADAPTER = TypeAdapter(TournamentData)
+    return _TOURNAMENT_ADAPTER
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Container for validation results."""
 
-    def __init__(self) -> None:
-        self.passed: list[str] = []
-        self.failed: list[str] = []
-        self.warnings: list[str] = []
+    passed: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
 
     def add_pass(self, check: str) -> None:
         """Record a passed check."""
@@ -42,6 +76,84 @@ class ValidationResult:
         return len(self.failed) == 0
 
 
+@dataclass(slots=True)
+class TeamScan:
+    """Per-team validation inputs accumulated in a single pass.
+
+    Each validator used to re-iterate the teams list with its own loop;
+    scanning once and handing the collected lists to the checks keeps
+    the traversal (and the repeated dict probes) down to one pass.
+    """
+
+    ids: list = field(default_factory=list)
+    elos: list[float] = field(default_factory=list)
+    rankings: list[int] = field(default_factory=list)
+    market_values: list[float] = field(default_factory=list)
+    bad_elo: list[tuple[str, float]] = field(default_factory=list)
+    bad_fifa: list[tuple[str, int]] = field(default_factory=list)
+    negative_mv: list[tuple[str, float]] = field(default_factory=list)
+    bad_conf: list[tuple[str, str]] = field(default_factory=list)
+    bad_code: list[tuple[str, str]] = field(default_factory=list)
+    bad_wins: list[tuple[str, object]] = field(default_factory=list)
+    total_wins: int = 0
+    winners: int = 0
+
+
+def _scan_teams(teams: list[dict]) -> TeamScan:
+    """Scan the teams list once, collecting inputs for every team check.
+
+    Args:
+        teams: List of team dictionaries from the loaded data.
+
+    Returns:
+        TeamScan with IDs and per-check offender lists filled in.
+    """
+    scan = TeamScan()
+    if not teams:
+        return scan
+
+    append_id = scan.ids.append
+
+    for team in teams:
+        # Bind the dict lookup once per row; every field below reuses it
+        get = team.get
+        name = get("name", "Unknown")
+
+        append_id(get("id"))
+
+        elo = get("elo_rating", 0)
+        scan.elos.append(elo)
+        if not (1000 <= elo <= 2500):
+            scan.bad_elo.append((name, elo))
+
+        ranking = get("fifa_ranking", 0)
+        scan.rankings.append(ranking)
+        if not (1 <= ranking <= 211):
+            scan.bad_fifa.append((name, ranking))
+
+        value = get("market_value_millions", 0)
+        scan.market_values.append(value)
+        if value < 0:
+            scan.negative_mv.append((name, value))
+
+        conf = get("confederation", "")
+        if conf not in _VALID_CONFEDERATIONS:
+            scan.bad_conf.append((name, conf))
+
+        code = get("code", "")
+        if _CODE_RE.fullmatch(code) is None:
+            scan.bad_code.append((name, code))
+
+        wins = get("world_cup_wins")
+        if not isinstance(wins, int) or wins < 0:
+            scan.bad_wins.append((name, wins))
+        elif wins > 0:
+            scan.total_wins += wins
+            scan.winners += 1
+
+    return scan
+
+
 def validate_team_count(data: dict, result: ValidationResult) -> None:
     """Validate exactly 48 teams are present.
 
@@ -74,17 +186,15 @@ def validate_group_count(data: dict, result: ValidationResult) -> None:
         result.add_fail(f"Group count: {count} (expected 12)")
 
 
-def validate_team_ids(data: dict, result: ValidationResult) -> None:
+def validate_team_ids(scan: TeamScan, result: ValidationResult) -> None:
     """Validate all team IDs are 0-47 and present.
 
     Args:
-        data: The loaded tournament data.
+        scan: Accumulated team scan.
         result: ValidationResult to update.
     """
-    teams = data.get("teams", [])
-    ids = [t.get("id") for t in teams]
     expected_ids = set(range(48))
-    actual_ids = set(ids)
+    actual_ids = set(scan.ids)
 
     # Check for missing IDs
     missing = expected_ids - actual_ids
@@ -99,44 +209,49 @@ def validate_team_ids(data: dict, result: ValidationResult) -> None:
         result.add_fail(f"Invalid team IDs (out of range): {sorted(extra)}")
 
 
-def validate_no_duplicate_ids(data: dict, result: ValidationResult) -> None:
+def validate_no_duplicate_ids(scan: TeamScan, result: ValidationResult) -> None:
     """Validate no duplicate team IDs.
 
     Args:
-        data: The loaded tournament data.
+        scan: Accumulated team scan.
         result: ValidationResult to update.
     """
-    teams = data.get("teams", [])
-    ids = [t.get("id") for t in teams]
-    counter = Counter(ids)
+    ids = scan.ids
 
-    duplicates = {id_: count for id_, count in counter.items() if count > 1}
-    if duplicates:
-        result.add_fail(f"Duplicate team IDs: {duplicates}")
-    else:
+    # Cheap length check first; the Counter is only built on the error
+    # path to report which IDs repeat.
+    if len(set(ids)) == len(ids):
         result.add_pass("No duplicate team IDs")
+        return
 
+    counter = Counter(ids)
+    duplicates = {id_: count for id_, count in counter.items() if count > 1}
+    result.add_fail(f"Duplicate team IDs: {duplicates}")
 
-def validate_group_team_references(data: dict, result: ValidationResult) -> None:
+
+def validate_group_team_references(
+    data: dict, scan: TeamScan, result: ValidationResult
+) -> None:
     """Validate all group team references exist.
 
     Args:
         data: The loaded tournament data.
+        scan: Accumulated team scan.
         result: ValidationResult to update.
     """
-    teams = data.get("teams", [])
     groups = data.get("groups", [])
 
-    valid_ids = {t.get("id") for t in teams}
-    invalid_refs = []
+    valid_ids = set(scan.ids)
+    invalid_refs: list[tuple] = []
 
+    # extend with a generator keeps the membership test in a C-level loop
+    # and only touches group IDs for rows that actually fail
     for group in groups:
-        group_id = group.get("id", "?")
-        team_ids = group.get("teams", [])
-
-        for team_id in team_ids:
-            if team_id not in valid_ids:
-                invalid_refs.append((group_id, team_id))
+        invalid_refs.extend(
+            (group.get("id", "?"), team_id)
+            for team_id in group.get("teams", ())
+            if team_id not in valid_ids
+        )
 
     if invalid_refs:
         result.add_fail(f"Invalid group team references: {invalid_refs}")
@@ -154,10 +269,9 @@ def validate_group_structure(data: dict, result: ValidationResult) -> None:
     groups = data.get("groups", [])
 
     # Check group IDs are A-L in order
-    expected_ids = [chr(ord("A") + i) for i in range(12)]
     actual_ids = [g.get("id") for g in groups]
 
-    if actual_ids != expected_ids:
+    if tuple(actual_ids) != _EXPECTED_GROUP_IDS:
         result.add_fail(f"Group IDs not A-L in order: {actual_ids}")
     else:
         result.add_pass("Group IDs are A-L in correct order")
@@ -176,22 +290,14 @@ def validate_group_structure(data: dict, result: ValidationResult) -> None:
         result.add_pass("All groups have exactly 4 teams")
 
 
-def validate_elo_ratings(data: dict, result: ValidationResult) -> None:
+def validate_elo_ratings(scan: TeamScan, result: ValidationResult) -> None:
     """Validate ELO ratings are in valid range (1000-2500).
 
     Args:
-        data: The loaded tournament data.
+        scan: Accumulated team scan.
         result: ValidationResult to update.
     """
-    teams = data.get("teams", [])
-    out_of_range = []
-
-    for team in teams:
-        name = team.get("name", "Unknown")
-        elo = team.get("elo_rating", 0)
-
-        if not (1000 <= elo <= 2500):
-            out_of_range.append((name, elo))
+    out_of_range = scan.bad_elo
 
     if out_of_range:
         result.add_fail(f"ELO ratings out of range (1000-2500): {out_of_range[:5]}")
@@ -201,22 +307,14 @@ def validate_elo_ratings(data: dict, result: ValidationResult) -> None:
         result.add_pass("All ELO ratings in valid range (1000-2500)")
 
 
-def validate_fifa_rankings(data: dict, result: ValidationResult) -> None:
+def validate_fifa_rankings(scan: TeamScan, result: ValidationResult) -> None:
     """Validate FIFA rankings are in valid range (1-211).
 
     Args:
-        data: The loaded tournament data.
+        scan: Accumulated team scan.
         result: ValidationResult to update.
     """
-    teams = data.get("teams", [])
-    out_of_range = []
-
-    for team in teams:
-        name = team.get("name", "Unknown")
-        ranking = team.get("fifa_ranking", 0)
-
-        if not (1 <= ranking <= 211):
-            out_of_range.append((name, ranking))
+    out_of_range = scan.bad_fifa
 
     if out_of_range:
         result.add_fail(f"FIFA rankings out of range (1-211): {out_of_range[:5]}")
@@ -226,22 +324,14 @@ def validate_fifa_rankings(data: dict, result: ValidationResult) -> None:
         result.add_pass("All FIFA rankings in valid range (1-211)")
 
 
-def validate_market_values(data: dict, result: ValidationResult) -> None:
+def validate_market_values(scan: TeamScan, result: ValidationResult) -> None:
     """Validate market values are non-negative.
 
     Args:
-        data: The loaded tournament data.
+        scan: Accumulated team scan.
         result: ValidationResult to update.
     """
-    teams = data.get("teams", [])
-    negative = []
-
-    for team in teams:
-        name = team.get("name", "Unknown")
-        value = team.get("market_value_millions", 0)
-
-        if value < 0:
-            negative.append((name, value))
+    negative = scan.negative_mv
 
     if negative:
         result.add_fail(f"Negative market values: {negative}")
@@ -249,23 +339,14 @@ def validate_market_values(data: dict, result: ValidationResult) -> None:
         result.add_pass("All market values are non-negative")
 
 
-def validate_confederations(data: dict, result: ValidationResult) -> None:
+def validate_confederations(scan: TeamScan, result: ValidationResult) -> None:
     """Validate confederations are valid.
 
     Args:
-        data: The loaded tournament data.
+        scan: Accumulated team scan.
         result: ValidationResult to update.
     """
-    valid_confederations = {"UEFA", "CONMEBOL", "CONCACAF", "CAF", "AFC", "OFC"}
-    teams = data.get("teams", [])
-    invalid = []
-
-    for team in teams:
-        name = team.get("name", "Unknown")
-        conf = team.get("confederation", "")
-
-        if conf not in valid_confederations:
-            invalid.append((name, conf))
+    invalid = scan.bad_conf
 
     if invalid:
         result.add_fail(f"Invalid confederations: {invalid}")
@@ -273,22 +354,14 @@ def validate_confederations(data: dict, result: ValidationResult) -> None:
         result.add_pass("All confederations are valid")
 
 
-def validate_team_codes(data: dict, result: ValidationResult) -> None:
+def validate_team_codes(scan: TeamScan, result: ValidationResult) -> None:
     """Validate team codes are 3-letter uppercase.
 
     Args:
-        data: The loaded tournament data.
+        scan: Accumulated team scan.
         result: ValidationResult to update.
     """
-    teams = data.get("teams", [])
-    invalid = []
-
-    for team in teams:
-        name = team.get("name", "Unknown")
-        code = team.get("code", "")
-
-        if not (len(code) == 3 and code.isupper() and code.isalpha()):
-            invalid.append((name, code))
+    invalid = scan.bad_code
 
     if invalid:
         result.add_fail(f"Invalid team codes (not 3-letter uppercase): {invalid}")
@@ -296,22 +369,14 @@ def validate_team_codes(data: dict, result: ValidationResult) -> None:
         result.add_pass("All team codes are valid 3-letter uppercase")
 
 
-def validate_world_cup_wins(data: dict, result: ValidationResult) -> None:
+def validate_world_cup_wins(scan: TeamScan, result: ValidationResult) -> None:
     """Validate world cup wins are non-negative integers.
 
     Args:
-        data: The loaded tournament data.
+        scan: Accumulated team scan.
         result: ValidationResult to update.
     """
-    teams = data.get("teams", [])
-    invalid = []
-
-    for team in teams:
-        name = team.get("name", "Unknown")
-        wins = team.get("world_cup_wins")
-
-        if not isinstance(wins, int) or wins < 0:
-            invalid.append((name, wins))
+    invalid = scan.bad_wins
 
     if invalid:
         result.add_fail(f"Invalid world cup wins: {invalid}")
@@ -319,26 +384,93 @@ def validate_world_cup_wins(data: dict, result: ValidationResult) -> None:
         result.add_pass("All world cup wins are valid non-negative integers")
 
 
-def validate_pydantic(data: dict, result: ValidationResult) -> None:
+def validate_pydantic(raw: bytes, result: ValidationResult) -> None:
     """Validate against Pydantic TournamentData model.
 
+    Validating the raw bytes lets pydantic-core parse and check the JSON
+    in one Rust pass instead of re-walking the already-parsed dict tree.
+
     Args:
-        data: The loaded tournament data.
+        raw: Raw bytes of the teams file.
         result: ValidationResult to update.
     """
     try:
-        TournamentData(**data)
+        _get_tournament_adapter().validate_json(raw)
         result.add_pass("Pydantic TournamentData validation passed")
     except Exception as e:
         result.add_fail(f"Pydantic validation failed: {e}")
 
 
+def _cache_key(raw: bytes) -> str:
+    """Compute the memo key for a teams file.
+
+    The key hashes the file bytes together with the TournamentData JSON
+    schema, so editing the file or changing the model both invalidate
+    any cached result.
+
+    Args:
+        raw: Raw bytes of the teams file.
+
+    Returns:
+        Hex digest usable as a cache filename.
+    """
+    digest = hashlib.blake2b(raw)
+    digest.update(
+        jsonio.dumps(_get_tournament_adapter().json_schema(), pretty=False)
+    )
+    return digest.hexdigest()
+
+
+def _load_cached_result(key: str) -> ValidationResult | None:
+    """Load a memoized validation result, if one exists for this key.
+
+    Only passing results are ever stored, so a hit means the file is
+    known valid for the current schema.
+
+    Args:
+        key: Cache key from _cache_key.
+
+    Returns:
+        Reconstructed ValidationResult, or None on miss or unreadable cache.
+    """
+    try:
+        cached = jsonio.loads((_VALIDATE_CACHE_DIR / f"{key}.json").read_bytes())
+        result = ValidationResult()
+        result.passed = list(cached["passed"])
+        result.warnings = list(cached["warnings"])
+        return result
+    except (OSError, jsonio.JSONDecodeError, KeyError, TypeError):
+        return None
+
+
+def _store_cached_result(key: str, result: ValidationResult) -> None:
+    """Persist a passing validation result; best effort only.
+
+    Args:
+        key: Cache key from _cache_key.
+        result: The passing result to store.
+    """
+    try:
+        _VALIDATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = _VALIDATE_CACHE_DIR / f"{key}.json"
+        tmp_path = cache_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(
+            jsonio.dumps({"passed": result.passed, "warnings": result.warnings})
+        )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # An unwritable cache dir just means no memo next run
+        pass
+
+
 def display_results(result: ValidationResult) -> None:
     """Display validation results in a formatted table.
 
     Args:
         result: The validation results to display.
     """
+    from rich.table import Table
+
     table = Table(title="Validation Results", show_header=True, header_style="bold")
     table.add_column("Status", width=8, justify="center")
     table.add_column("Check")
@@ -358,11 +490,12 @@ def display_results(result: ValidationResult) -> None:
             console.print(f"  [dim]- {warning}[/dim]")
 
 
-def display_summary(data: dict, result: ValidationResult) -> None:
+def display_summary(data: dict, scan: TeamScan, result: ValidationResult) -> None:
     """Display data summary.
 
     Args:
         data: The loaded tournament data.
+        scan: Accumulated team scan with the numeric columns.
         result: The validation results.
     """
     teams = data.get("teams", [])
@@ -370,6 +503,8 @@ def display_summary(data: dict, result: ValidationResult) -> None:
     if not teams:
         return
 
+    from rich.table import Table
+
     console.print()
     summary_table = Table(title="Data Summary")
     summary_table.add_column("Metric", style="cyan")
@@ -378,28 +513,27 @@ def display_summary(data: dict, result: ValidationResult) -> None:
     summary_table.add_row("Total teams", str(len(teams)))
     summary_table.add_row("Total groups", str(len(data.get("groups", []))))
 
-    # ELO stats
-    elos = [t.get("elo_rating", 0) for t in teams]
+    # Numeric stats reduce the columns the scan already collected, so
+    # the teams list isn't traversed again per metric
+    elos = scan.elos
     summary_table.add_row("ELO range", f"{min(elos):.0f} - {max(elos):.0f}")
     summary_table.add_row("Average ELO", f"{sum(elos) / len(elos):.0f}")
 
-    # FIFA ranking stats
-    rankings = [t.get("fifa_ranking", 0) for t in teams]
+    rankings = scan.rankings
     summary_table.add_row("FIFA ranking range", f"{min(rankings)} - {max(rankings)}")
 
-    # Market value stats
-    values = [t.get("market_value_millions", 0) for t in teams]
+    values = scan.market_values
     summary_table.add_row("Total market value", f"{sum(values):.0f}M")
     summary_table.add_row("Average market value", f"{sum(values) / len(values):.1f}M")
 
-    # World Cup wins
-    total_wins = sum(t.get("world_cup_wins", 0) for t in teams)
-    winners = sum(1 for t in teams if t.get("world_cup_wins", 0) > 0)
-    summary_table.add_row("Past World Cup winners", f"{winners} teams ({total_wins} titles)")
+    # World Cup wins, tallied inline by the scan
+    summary_table.add_row(
+        "Past World Cup winners", f"{scan.winners} teams ({scan.total_wins} titles)"
+    )
 
     # Confederation breakdown
     conf_counts = Counter(t.get("confederation") for t in teams)
-    for conf in ["UEFA", "CONMEBOL", "CONCACAF", "CAF", "AFC", "OFC"]:
+    for conf in _CONFEDERATION_ORDER:
         count = conf_counts.get(conf, 0)
         summary_table.add_row(f"{conf} teams", str(count))
 
@@ -445,6 +579,8 @@ def validate(teams_file: Path, quiet: bool, summary: bool) -> None:
     Returns exit code 0 on success, 1 on failure.
     """
     if not quiet:
+        from rich.panel import Panel
+
         console.print(
             Panel(
                 "[bold blue]Teams.json Validator[/bold blue]\n"
@@ -454,33 +590,45 @@ def validate(teams_file: Path, quiet: bool, summary: bool) -> None:
         )
         console.print()
 
-    # Load the file
+    # Load the file in one read; jsonio parses with orjson when available.
+    # The raw bytes are kept so the Pydantic check can parse them directly.
+    raw = teams_file.read_bytes()
     try:
-        with open(teams_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        data = jsonio.loads(raw)
+    except jsonio.JSONDecodeError as e:
         if quiet:
             click.echo("FAIL: Invalid JSON")
         else:
             console.print(f"[bold red]Invalid JSON:[/bold red] {e}")
         sys.exit(1)
 
-    # Run all validations
-    result = ValidationResult()
-
-    validate_team_count(data, result)
-    validate_group_count(data, result)
-    validate_team_ids(data, result)
-    validate_no_duplicate_ids(data, result)
-    validate_group_team_references(data, result)
-    validate_group_structure(data, result)
-    validate_elo_ratings(data, result)
-    validate_fifa_rankings(data, result)
-    validate_market_values(data, result)
-    validate_confederations(data, result)
-    validate_team_codes(data, result)
-    validate_world_cup_wins(data, result)
-    validate_pydantic(data, result)
+    # Unchanged content + unchanged schema means the checks can't differ;
+    # reuse the memoized (always passing) result when one exists.
+    key = _cache_key(raw)
+    result = _load_cached_result(key)
+    scan = None
+
+    if result is None:
+        # Run all validations; the per-team checks share one pass over teams
+        result = ValidationResult()
+        scan = _scan_teams(data.get("teams", []))
+
+        validate_team_count(data, result)
+        validate_group_count(data, result)
+        validate_team_ids(scan, result)
+        validate_no_duplicate_ids(scan, result)
+        validate_group_team_references(data, scan, result)
+        validate_group_structure(data, result)
+        validate_elo_ratings(scan, result)
+        validate_fifa_rankings(scan, result)
+        validate_market_values(scan, result)
+        validate_confederations(scan, result)
+        validate_team_codes(scan, result)
+        validate_world_cup_wins(scan, result)
+        validate_pydantic(raw, result)
+
+        if result.is_valid:
+            _store_cached_result(key, result)
 
     # Display results
     if quiet:
@@ -507,7 +655,10 @@ def validate(teams_file: Path, quiet: bool, summary: bool) -> None:
             )
 
         if summary:
-            display_summary(data, result)
+            # A memoized run skipped the scan; the summary still needs it
+            if scan is None:
+                scan = _scan_teams(data.get("teams", []))
+            display_summary(data, scan, result)
 
     # Exit with appropriate code
     sys.exit(0 if result.is_valid else 1)
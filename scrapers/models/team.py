@@ -6,6 +6,10 @@ from typing import Annotated, Literal
 from pydantic import BaseModel, Field, field_validator
 
 
+# The 12 group letters A-L, built once instead of per validation call.
+_GROUP_IDS = [chr(ord("A") + i) for i in range(12)]
+
+
 class Confederation(str, Enum):
     """FIFA confederation - matches Rust Confederation enum."""
 
@@ -100,9 +104,8 @@ class TournamentData(BaseModel):
     @classmethod
     def validate_groups(cls, v: list[Group]) -> list[Group]:
         """Validate group letters are A-L in order."""
-        expected_ids = [chr(ord("A") + i) for i in range(12)]
         actual_ids = [g.id for g in v]
-        if actual_ids != expected_ids:
+        if actual_ids != _GROUP_IDS:
             raise ValueError(f"Groups must be A-L in order, got {actual_ids}")
         return v
 
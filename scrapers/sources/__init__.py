@@ -1,8 +1,28 @@
-"""Scraper source implementations."""
+"""Scraper source implementations.
 
-from scrapers.sources.base import BaseScraper, ScraperError
-from scrapers.sources.elo_scraper import EloScraper
-from scrapers.sources.fifa_scraper import FifaScraper
-from scrapers.sources.groups_scraper import GroupsScraper
+Scrapers are resolved lazily (PEP 562) so importing the package doesn't
+pay for every scraper module when only one is used.
+"""
 
-__all__ = ["BaseScraper", "ScraperError", "EloScraper", "FifaScraper", "GroupsScraper"]
+import importlib
+
+_EXPORTS = {
+    "BaseScraper": "scrapers.sources.base",
+    "ScraperError": "scrapers.sources.base",
+    "EloScraper": "scrapers.sources.elo_scraper",
+    "FifaScraper": "scrapers.sources.fifa_scraper",
+    "GroupsScraper": "scrapers.sources.groups_scraper",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Resolve exported scrapers on first access and cache them."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,14 +1,16 @@
 """Base scraper abstract class."""
 
-import json
 import logging
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import requests
 
 from scrapers.config.settings import USER_AGENT, TIMEOUT
+from scrapers.utils import jsonio
 from scrapers.utils.http import create_session
 
 
@@ -24,12 +26,21 @@ class BaseScraper(ABC):
     def __init__(self, output_dir: Path) -> None:
         """Initialize the scraper.
 
+        When the ``SCRAPER_CACHE_DIR`` environment variable is set, the
+        session is backed by an on-disk response cache there, so repeated
+        dev/CI runs skip re-downloading pages that rarely change within
+        a day.
+
         Args:
             output_dir: Directory where output files will be saved.
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.session = create_session()
+        cache_dir = os.environ.get("SCRAPER_CACHE_DIR")
+        self.session = create_session(
+            cache_path=Path(cache_dir) / "scraper" if cache_dir else None,
+            expire_after_hours=1.0,
+        )
         self.logger = logging.getLogger(self.__class__.__name__)
 
     @abstractmethod
@@ -53,6 +64,36 @@ class BaseScraper(ABC):
         """
         pass
 
+    @staticmethod
+    def run_all(scrapers: "list[BaseScraper]") -> dict[str, Any]:
+        """Run several independent scrapers concurrently.
+
+        The scrapers hit disjoint hosts and are I/O-bound, so running
+        them on a thread pool overlaps their network waits instead of
+        summing them. Each scraper owns its own session, so no locking
+        is needed; the only state they share is the process-wide
+        connection adapter, whose urllib3 pools are thread-safe.
+
+        Args:
+            scrapers: Scraper instances to run.
+
+        Returns:
+            Mapping of each scraper's output filename to its scraped
+            data, in the order the scrapers were given.
+
+        Raises:
+            ScraperError: Propagated from the first failing scraper.
+        """
+        if not scrapers:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+            futures = {
+                scraper.get_output_filename(): executor.submit(scraper.scrape)
+                for scraper in scrapers
+            }
+            return {name: future.result() for name, future in futures.items()}
+
     def save(self, data: Any) -> Path:
         """Save data to a JSON file.
 
@@ -68,8 +109,9 @@ class BaseScraper(ABC):
         if hasattr(data, "model_dump"):
             data = data.model_dump(mode="json")
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Serialize in memory and write once instead of streaming many
+        # small text writes through json.dump
+        output_path.write_bytes(jsonio.dumps(data))
 
         self.logger.info(f"Saved data to {output_path}")
         return output_path
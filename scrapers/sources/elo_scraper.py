@@ -1,13 +1,23 @@
 """ELO ratings scraper from international-football.net."""
 
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from .base import BaseScraper
+from ..utils.http import create_session
+
+
+# Fast-path pattern for the rating; a raw-string search is orders of
+# magnitude cheaper than building the parse tree, so it runs first and
+# the table walk only handles pages where it misses.
+_ELO_RE = re.compile(r"Elo\s*Score[^\d]*(\d{4})")
 
 
 class EloScraper(BaseScraper):
@@ -20,16 +30,39 @@ class EloScraper(BaseScraper):
     BASE_URL = "https://www.international-football.net/country"
     RATE_LIMIT_DELAY = 1.0  # seconds between requests
 
-    def __init__(self, output_dir: Path, team_names: list[str] | None = None) -> None:
+    def __init__(
+        self,
+        output_dir: Path,
+        team_names: list[str] | None = None,
+        max_workers: int = 1,
+    ) -> None:
         """Initialize the ELO scraper.
 
         Args:
             output_dir: Directory where output files will be saved.
             team_names: Optional list of team names to scrape. If None, must be provided to scrape().
+            max_workers: Number of parallel fetch threads. The shared
+                limiter keeps request starts RATE_LIMIT_DELAY apart
+                regardless of this; extra threads overlap response
+                latency and parsing, not the request rate.
         """
         super().__init__(output_dir)
+        # Cache team pages on disk so re-runs skip the network entirely
+        # for unexpired responses
+        self.session = create_session(cache_path=self.output_dir / ".http_cache")
         self.team_names = team_names or []
-        self._last_request_time = 0.0
+        self.max_workers = max_workers
+        # Shared across all workers and NOT divided by the worker count:
+        # the aggregate request rate stays at one per RATE_LIMIT_DELAY
+        # no matter how many threads overlap their waits.
+        self.min_interval = self.RATE_LIMIT_DELAY
+        self.cache_hits = 0
+        self._rate_lock = threading.Lock()
+        # Monotonic timestamp: immune to wall-clock jumps (NTP, DST)
+        self._last_request_monotonic = 0.0
+        # In-process memo so repeat requests for the same team (retries,
+        # alias passes) don't re-fetch within one run
+        self._team_cache: dict[str, int | None] = {}
 
     def get_output_filename(self) -> str:
         """Get the output filename for this scraper.
@@ -39,12 +72,21 @@ class EloScraper(BaseScraper):
         """
         return "elo_ratings.json"
 
-    def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - elapsed)
-        self._last_request_time = time.time()
+    def _rate_limit(self) -> float:
+        """Enforce the shared rate limit across worker threads.
+
+        Returns:
+            The timestamp stamped for this request, so the cache-hit
+            refund can compare-and-reset it without clobbering a newer
+            stamp written by another worker in the meantime.
+        """
+        with self._rate_lock:
+            elapsed = time.monotonic() - self._last_request_monotonic
+            if elapsed < self.min_interval:
+                time.sleep(self.min_interval - elapsed)
+            stamp = time.monotonic()
+            self._last_request_monotonic = stamp
+            return stamp
 
     def scrape(self, team_names: list[str] | None = None) -> dict[str, Any]:
         """Scrape ELO ratings for specified teams.
@@ -67,14 +109,25 @@ class EloScraper(BaseScraper):
 
         teams: dict[str, int] = {}
 
-        for team_name in teams_to_scrape:
-            self._rate_limit()
-            rating = self._scrape_team(team_name)
-            if rating is not None:
-                teams[team_name] = rating
-                self.logger.info(f"  {team_name}: {rating}")
-            else:
-                self.logger.warning(f"  {team_name}: No rating found")
+        # Fetch in parallel; the shared rate limiter keeps the aggregate
+        # request rate unchanged, so threads overlap latency, not load.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._scrape_team, name): name
+                for name in teams_to_scrape
+            }
+            for future in as_completed(futures):
+                team_name = futures[future]
+                rating = future.result()
+                if rating is not None:
+                    teams[team_name] = rating
+                    self.logger.info(f"  {team_name}: {rating}")
+                else:
+                    self.logger.warning(f"  {team_name}: No rating found")
+
+        # Futures complete in arbitrary order; restore input order so the
+        # output file stays stable across runs.
+        teams = {name: teams[name] for name in teams_to_scrape if name in teams}
 
         if not teams:
             self.fail_fast("No ELO ratings found for any team")
@@ -96,8 +149,15 @@ class EloScraper(BaseScraper):
         Returns:
             ELO rating as integer, or None if not found.
         """
+        # lru_cache can't memoize bound methods cleanly, so the memo is a
+        # plain per-instance dict keyed on the normalized name
+        key = team_name.strip().lower()
+        if key in self._team_cache:
+            return self._team_cache[key]
+
         url = f"{self.BASE_URL}?team={team_name}"
 
+        stamp = self._rate_limit()
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
@@ -105,7 +165,20 @@ class EloScraper(BaseScraper):
             self.logger.error(f"Failed to fetch {team_name}: {e}")
             return None
 
-        return self._parse_elo_from_page(response.text, team_name)
+        if getattr(response, "from_cache", False):
+            # Cache hits don't touch the network; roll the rate-limit
+            # window back so they don't delay real requests.
+            # Compare-and-reset: only refund our own stamp — a newer one
+            # belongs to another worker's real request and zeroing it
+            # would let the next caller fire back-to-back.
+            with self._rate_lock:
+                self.cache_hits += 1
+                if self._last_request_monotonic == stamp:
+                    self._last_request_monotonic = 0.0
+
+        rating = self._parse_elo_from_page(response.text, team_name)
+        self._team_cache[key] = rating
+        return rating
 
     def _parse_elo_from_page(self, html_content: str, team_name: str) -> int | None:
         """Parse ELO rating from team page HTML.
@@ -121,28 +194,30 @@ class EloScraper(BaseScraper):
         Returns:
             ELO rating as integer, or None if not found.
         """
-        soup = BeautifulSoup(html_content, "lxml")
+        # Fast path: search the raw string before instantiating a parser
+        match = _ELO_RE.search(html_content)
+        if match:
+            rating = int(match.group(1))
+            if 1000 <= rating <= 2500:
+                return rating
 
-        # Find tables and look for 'Elo Score' row
-        for table in soup.find_all("table"):
-            for row in table.find_all("tr"):
-                cells = row.find_all(["td", "th"])
+        # Fallback: stream-parse with lxml's pull parser, stopping at the
+        # first matching table row instead of building the whole document
+        parser = etree.HTMLPullParser(events=("end",), tag="tr")
+        for start in range(0, len(html_content), 4096):
+            parser.feed(html_content[start : start + 4096])
+            for _event, row in parser.read_events():
+                cells = [c for c in row if c.tag in ("td", "th")]
                 if len(cells) >= 2:
-                    label = cells[0].get_text(strip=True)
-                    value = cells[1].get_text(strip=True)
+                    label = "".join(cells[0].itertext()).strip()
+                    value = "".join(cells[1].itertext()).strip()
 
                     if label == "Elo Score" and value.isdigit():
                         rating = int(value)
                         if 1000 <= rating <= 2500:
                             return rating
-
-        # Fallback: search for pattern in text
-        import re
-        match = re.search(r"Elo\s*Score[^\d]*(\d{4})", html_content)
-        if match:
-            rating = int(match.group(1))
-            if 1000 <= rating <= 2500:
-                return rating
+                # Drop inspected rows so memory stays bounded by one chunk
+                row.clear()
 
         self.logger.warning(f"Could not parse ELO rating for {team_name}")
         return None
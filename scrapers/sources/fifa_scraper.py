@@ -1,11 +1,14 @@
 """FIFA world rankings scraper."""
 
+import json
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
 
 from scrapers.sources.base import BaseScraper, ScraperError
@@ -25,6 +28,34 @@ FIFA_RANKINGS_PAGE = "https://www.fifa.com/fifa-world-ranking/men"
 # Wikipedia fallback
 WIKIPEDIA_RANKINGS_PAGE = "https://en.wikipedia.org/wiki/FIFA_Men%27s_World_Ranking"
 
+# Patterns used inside the per-element parse loops, compiled once
+_NON_DIGIT_RE = re.compile(r"\D")
+_RANK_TEXT_RE = re.compile(r"^(\d+)\s+([A-Za-z\s]+)")
+
+# Shared decoder for scanning JSON fragments embedded in script tags
+_JSON_DECODER = json.JSONDecoder()
+
+# Ranking row selectors FIFA has used historically, comma-grouped so one
+# soupsieve pass walks the DOM instead of one traversal per selector
+_RANKING_ROW_SELECTOR = ", ".join(
+    [
+        "tr[data-team-name]",
+        ".ranking-item",
+        ".rank-table-row",
+        "[class*='RankingItem']",
+        "[class*='ranking-table'] tr",
+    ]
+)
+
+# Per-element selectors compiled once; soupsieve caches by string identity
+# only, so precompiling avoids a parse per _extract_rank_from_element call
+_RANK_SELECTOR = soupsieve.compile(
+    ".rank, .position, [class*='Rank'], [class*='position']"
+)
+_NAME_SELECTOR = soupsieve.compile(
+    ".team-name, .country-name, [class*='TeamName'], [class*='countryName']"
+)
+
 # Headers required by FIFA API
 FIFA_API_HEADERS = {
     "Accept": "application/json",
@@ -65,16 +96,10 @@ class FifaScraper(BaseScraper):
         """
         self.logger.info("Starting FIFA rankings scrape")
 
-        # Try API endpoints first
-        for endpoint in FIFA_API_ENDPOINTS:
-            try:
-                self.logger.info(f"Trying API endpoint: {endpoint}")
-                rankings = self._fetch_from_api(endpoint)
-                if rankings:
-                    return self._format_output(rankings, "fifa.com/api")
-            except Exception as e:
-                self.logger.warning(f"API endpoint {endpoint} failed: {e}")
-                continue
+        # Race the API endpoints; any single success is sufficient
+        rankings = self._race_api_endpoints()
+        if rankings:
+            return self._format_output(rankings, "fifa.com/api")
 
         # Fall back to HTML scraping
         self.logger.info("API endpoints failed, trying HTML scrape")
@@ -83,7 +108,7 @@ class FifaScraper(BaseScraper):
             if rankings:
                 return self._format_output(rankings, "fifa.com/html")
         except Exception as e:
-            self.logger.error(f"HTML scrape failed: {e}")
+            self.logger.error("HTML scrape failed: %s", e)
 
         # Final fallback: Wikipedia
         self.logger.info("FIFA sources failed, trying Wikipedia")
@@ -92,7 +117,7 @@ class FifaScraper(BaseScraper):
             if rankings:
                 return self._format_output(rankings, "wikipedia.org")
         except Exception as e:
-            self.logger.error(f"Wikipedia scrape failed: {e}")
+            self.logger.error("Wikipedia scrape failed: %s", e)
 
         self.fail_fast(
             "Failed to fetch FIFA rankings from all sources. "
@@ -100,6 +125,39 @@ class FifaScraper(BaseScraper):
             "Please check https://www.fifa.com/fifa-world-ranking/men manually."
         )
 
+    def _race_api_endpoints(self) -> dict[str, int] | None:
+        """Try all FIFA API endpoints concurrently, taking the first success.
+
+        The endpoints are alternates for the same data, so instead of
+        waiting for each to fail in turn, they are fetched in parallel
+        and the first parseable response wins. Requests still in flight
+        for losing endpoints are abandoned.
+
+        Returns:
+            Dict mapping team name to ranking position, or None if all
+            endpoints failed.
+        """
+        executor = ThreadPoolExecutor(max_workers=len(FIFA_API_ENDPOINTS))
+        futures = {
+            executor.submit(self._fetch_from_api, endpoint): endpoint
+            for endpoint in FIFA_API_ENDPOINTS
+        }
+        try:
+            for future in as_completed(futures):
+                endpoint = futures[future]
+                try:
+                    rankings = future.result()
+                except Exception as e:
+                    self.logger.warning("API endpoint %s failed: %s", endpoint, e)
+                    continue
+                if rankings:
+                    self.logger.info("Got rankings from %s", endpoint)
+                    return rankings
+            return None
+        finally:
+            # Don't block on losing endpoints; unstarted fetches are cancelled
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _fetch_from_api(self, endpoint: str) -> dict[str, int] | None:
         """Fetch rankings from a FIFA API endpoint.
 
@@ -109,9 +167,12 @@ class FifaScraper(BaseScraper):
         Returns:
             Dict mapping team name to ranking position, or None if failed.
         """
-        headers = {**self.session.headers, **FIFA_API_HEADERS}
-
-        response = self.session.get(endpoint, headers=headers, timeout=TIMEOUT)
+        # Pass only the FIFA-specific headers; requests merges them over
+        # the session defaults per request, keeping the session (and its
+        # pooled keep-alive connections) untouched.
+        response = self.session.get(
+            endpoint, headers=FIFA_API_HEADERS, timeout=TIMEOUT
+        )
         response.raise_for_status()
 
         data = response.json()
@@ -170,7 +231,7 @@ class FifaScraper(BaseScraper):
                         rankings[name] = int(rank)
 
         if rankings:
-            self.logger.info(f"Parsed {len(rankings)} teams from API response")
+            self.logger.info("Parsed %d teams from API response", len(rankings))
             return rankings
 
         self.logger.warning("Could not parse rankings from API response structure")
@@ -182,43 +243,36 @@ class FifaScraper(BaseScraper):
         Returns:
             Dict mapping team name to ranking position, or None if failed.
         """
-        headers = {**self.session.headers}
-        headers["Accept"] = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
-
-        response = self.session.get(FIFA_RANKINGS_PAGE, headers=headers, timeout=TIMEOUT)
+        response = self.session.get(
+            FIFA_RANKINGS_PAGE,
+            headers={
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+            },
+            timeout=TIMEOUT,
+        )
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        # Hand lxml the raw bytes; it resolves the encoding itself, which
+        # skips the full decoded-string copy response.text would allocate
+        soup = BeautifulSoup(response.content, "lxml")
         rankings: dict[str, int] = {}
 
-        # Look for ranking table rows
-        # FIFA uses various class patterns, try multiple selectors
-        selectors = [
-            "tr[data-team-name]",
-            ".ranking-item",
-            ".rank-table-row",
-            "[class*='RankingItem']",
-            "[class*='ranking-table'] tr",
-        ]
-
-        for selector in selectors:
-            elements = soup.select(selector)
-            if elements:
-                self.logger.debug(f"Found {len(elements)} elements with selector: {selector}")
-                for elem in elements:
-                    rank, name = self._extract_rank_from_element(elem)
-                    if rank and name:
-                        rankings[name] = rank
-
-                if rankings:
-                    break
+        # Look for ranking table rows; FIFA uses various class patterns,
+        # matched in one unioned selector pass
+        elements = soup.select(_RANKING_ROW_SELECTOR)
+        if elements:
+            self.logger.debug("Found %d candidate ranking elements", len(elements))
+            for elem in elements:
+                rank, name = self._extract_rank_from_element(elem)
+                if rank and name:
+                    rankings[name] = rank
 
         # Try extracting from JSON-LD or embedded JSON
         if not rankings:
             rankings = self._extract_from_embedded_json(soup)
 
         if rankings:
-            self.logger.info(f"Scraped {len(rankings)} teams from HTML")
+            self.logger.info("Scraped %d teams from HTML", len(rankings))
             return rankings
 
         return None
@@ -232,7 +286,7 @@ class FifaScraper(BaseScraper):
         response = self.session.get(WIKIPEDIA_RANKINGS_PAGE, timeout=TIMEOUT)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = BeautifulSoup(response.content, "lxml")
         rankings: dict[str, int] = {}
 
         # Find wikitables - the first one has current rankings
@@ -258,7 +312,7 @@ class FifaScraper(BaseScraper):
                     rankings[team_name] = int(rank_text)
 
         if rankings:
-            self.logger.info(f"Scraped {len(rankings)} teams from Wikipedia")
+            self.logger.info("Scraped %d teams from Wikipedia", len(rankings))
             return rankings
 
         return None
@@ -273,30 +327,27 @@ class FifaScraper(BaseScraper):
             Tuple of (rank, team_name) or (None, None) if not found.
         """
         rank = None
-        name = None
 
-        # Try data attributes
-        if elem.get("data-team-name"):
-            name = elem.get("data-team-name")
-        if elem.get("data-rank"):
+        # Try data attributes, reading each one once
+        name = elem.get("data-team-name")
+        rank_raw = elem.get("data-rank")
+        if rank_raw:
             try:
-                rank = int(elem.get("data-rank"))
+                rank = int(rank_raw)
             except (ValueError, TypeError):
                 pass
 
         # Try common class patterns for rank
-        rank_elem = elem.select_one(".rank, .position, [class*='Rank'], [class*='position']")
+        rank_elem = _RANK_SELECTOR.select_one(elem)
         if rank_elem:
             try:
                 rank_text = rank_elem.get_text(strip=True)
-                rank = int(re.sub(r"\D", "", rank_text))
+                rank = int(_NON_DIGIT_RE.sub("", rank_text))
             except (ValueError, TypeError):
                 pass
 
         # Try common class patterns for team name
-        name_elem = elem.select_one(
-            ".team-name, .country-name, [class*='TeamName'], [class*='countryName']"
-        )
+        name_elem = _NAME_SELECTOR.select_one(elem)
         if name_elem:
             name = name_elem.get_text(strip=True)
 
@@ -304,7 +355,7 @@ class FifaScraper(BaseScraper):
         if not name or not rank:
             text = elem.get_text(" ", strip=True)
             # Pattern like "1 Argentina" or "Argentina 1"
-            match = re.match(r"^(\d+)\s+([A-Za-z\s]+)", text)
+            match = _RANK_TEXT_RE.match(text)
             if match:
                 rank = int(match.group(1))
                 name = match.group(2).strip()
@@ -322,37 +373,72 @@ class FifaScraper(BaseScraper):
         """
         rankings: dict[str, int] = {}
 
-        # Look for script tags with ranking data
+        # Look for script tags with ranking data. Most scripts carry no
+        # rankings, so cheap substring tests skip them before the JSON scan.
         scripts = soup.find_all("script")
         for script in scripts:
-            if not script.string:
+            text = script.string
+            if not text:
                 continue
+            if "rank" not in text and "position" not in text:
+                continue
+            if "team" not in text and "country" not in text and "name" not in text:
+                continue
+            self._scan_script_json(text, rankings)
 
-            # Look for JSON-like structures with ranking data
-            # Pattern: {"rank":1,"team":"Argentina"} or similar
-            matches = re.findall(
-                r'"(?:rank|position)":\s*(\d+).*?"(?:team|teamName|name|country)":\s*"([^"]+)"',
-                script.string,
-            )
-            for rank_str, name in matches:
-                try:
-                    rankings[name] = int(rank_str)
-                except ValueError:
-                    continue
+        return rankings
+
+    def _scan_script_json(self, text: str, rankings: dict[str, int]) -> None:
+        """Scan a script body for JSON objects carrying ranking data.
+
+        Decodes each JSON fragment found at a ``{`` offset with
+        raw_decode and walks the result, which is linear in script size
+        (the regex approach backtracked across whole script bodies) and
+        handles nesting a flat pattern cannot.
 
-            # Also try reverse pattern
-            matches = re.findall(
-                r'"(?:team|teamName|name|country)":\s*"([^"]+)".*?"(?:rank|position)":\s*(\d+)',
-                script.string,
+        Args:
+            text: Raw script tag contents.
+            rankings: Dict to accumulate team name -> rank entries into.
+        """
+        idx = text.find("{")
+        while idx != -1:
+            try:
+                obj, end = _JSON_DECODER.raw_decode(text, idx)
+            except ValueError:
+                idx = text.find("{", idx + 1)
+                continue
+            self._collect_rank_entries(obj, rankings)
+            idx = text.find("{", end)
+
+    def _collect_rank_entries(self, obj: Any, rankings: dict[str, int]) -> None:
+        """Accumulate rank/name pairs from a decoded JSON fragment.
+
+        Args:
+            obj: Decoded JSON value (any nesting).
+            rankings: Dict to accumulate team name -> rank entries into.
+        """
+        if isinstance(obj, dict):
+            rank = obj.get("rank") or obj.get("position")
+            name = (
+                obj.get("team")
+                or obj.get("teamName")
+                or obj.get("name")
+                or obj.get("country")
             )
-            for name, rank_str in matches:
+            if isinstance(name, dict):
+                name = name.get("name") or name.get("teamName")
+            if rank and isinstance(name, str):
                 try:
-                    if name not in rankings:
-                        rankings[name] = int(rank_str)
-                except ValueError:
-                    continue
-
-        return rankings
+                    rankings.setdefault(name, int(rank))
+                except (TypeError, ValueError):
+                    pass
+            for value in obj.values():
+                if isinstance(value, (dict, list)):
+                    self._collect_rank_entries(value, rankings)
+        elif isinstance(obj, list):
+            for item in obj:
+                if isinstance(item, (dict, list)):
+                    self._collect_rank_entries(item, rankings)
 
     def _format_output(self, rankings: dict[str, int], source: str) -> dict[str, Any]:
         """Format the rankings data for output.
@@ -2,14 +2,41 @@
 
 import json
 import re
+from collections import Counter
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import soupsieve
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from scrapers.config.settings import TIMEOUT
 from scrapers.sources.base import BaseScraper, ScraperError
+from scrapers.utils import jsonio
+
+
+# Patterns used inside the parse loops, compiled once at module scope
+_GROUP_LETTER_RE = re.compile(r"^[A-L]$")
+_GROUP_HEADER_RE = re.compile(r"Group\s+([A-L])", re.IGNORECASE)
+_GROUP_HEADER_BYTES_RE = re.compile(rb"Group\s+[A-L]", re.IGNORECASE)
+_GROUP_CELL_RE = re.compile(r"^Group\s+([A-L])$", re.IGNORECASE)
+_GROUP_PREFIX_RE = re.compile(r"^Group\s")
+_TEAM_HREF_RE = re.compile(r"/team/")
+
+# Class-substring selector compiled once; one soupsieve pass replaces the
+# per-descendant regex test a class_= filter would run
+_TEAM_CLASS_SELECTOR = soupsieve.compile(
+    '[class*="team"], [class*="country"], [class*="nation"], '
+    '[class*="Team"], [class*="Country"], [class*="Nation"]'
+)
+
+
+@lru_cache(maxsize=4)
+def _parse_team_mapping(path: str, mtime: float) -> dict:
+    """Parse a team mapping file, cached on (path, mtime)."""
+    return jsonio.loads(Path(path).read_bytes())
 
 
 class GroupsScraper(BaseScraper):
@@ -29,8 +56,9 @@ class GroupsScraper(BaseScraper):
         "canadamexicousa2026/articles/final-draw-results"
     )
 
-    # Expected groups A-L
-    GROUP_LETTERS = [chr(ord("A") + i) for i in range(12)]
+    # Expected groups A-L; the frozenset backs O(1) membership checks
+    GROUP_LETTERS = tuple(chr(ord("A") + i) for i in range(12))
+    _GROUP_LETTER_SET = frozenset(GROUP_LETTERS)
     TEAMS_PER_GROUP = 4
 
     def __init__(self, output_dir: Path) -> None:
@@ -95,30 +123,32 @@ class GroupsScraper(BaseScraper):
             Dictionary mapping group letters to team lists, or None if failed.
         """
         try:
-            self.logger.info(f"Fetching {self.FIFA_TEAMS_URL}")
+            self.logger.info("Fetching %s", self.FIFA_TEAMS_URL)
             response = self.session.get(self.FIFA_TEAMS_URL, timeout=TIMEOUT)
             response.raise_for_status()
 
-            groups = self._parse_fifa_teams_page(response.text)
+            # The parsers take raw bytes; lxml resolves the encoding itself,
+            # which skips the decoded-string copy response.text allocates
+            groups = self._parse_fifa_teams_page(response.content)
             if groups:
                 return groups
 
             # Try the draw results page as fallback
-            self.logger.info(f"Trying draw results page: {self.FIFA_DRAW_URL}")
+            self.logger.info("Trying draw results page: %s", self.FIFA_DRAW_URL)
             response = self.session.get(self.FIFA_DRAW_URL, timeout=TIMEOUT)
             response.raise_for_status()
 
-            return self._parse_fifa_draw_page(response.text)
+            return self._parse_fifa_draw_page(response.content)
 
         except Exception as e:
-            self.logger.warning(f"Failed to scrape FIFA website: {e}")
+            self.logger.warning("Failed to scrape FIFA website: %s", e)
             return None
 
-    def _parse_fifa_teams_page(self, html: str) -> dict[str, list[str]] | None:
+    def _parse_fifa_teams_page(self, html: bytes) -> dict[str, list[str]] | None:
         """Parse FIFA teams page for group assignments.
 
         Args:
-            html: Raw HTML content from FIFA teams page.
+            html: Raw HTML bytes from FIFA teams page.
 
         Returns:
             Dictionary of groups or None if parsing fails.
@@ -127,13 +157,13 @@ class GroupsScraper(BaseScraper):
         groups: dict[str, list[str]] = {}
 
         # Look for group sections - FIFA typically uses data attributes or specific classes
-        # Try various selectors that FIFA has used historically
+        # Try various selectors that FIFA has used historically. Each pattern is
+        # gated on a cheap scan of the raw HTML so pages that cannot match skip
+        # the DOM traversal entirely.
 
         # Pattern 1: Look for elements with group data
-        group_elements = soup.find_all(
-            attrs={"data-group": re.compile(r"^[A-L]$")}
-        )
-        if group_elements:
+        if b"data-group" in html:
+            group_elements = soup.find_all(attrs={"data-group": _GROUP_LETTER_RE})
             for elem in group_elements:
                 group_letter = elem.get("data-group")
                 teams = self._extract_team_names(elem)
@@ -144,73 +174,75 @@ class GroupsScraper(BaseScraper):
             return groups
 
         # Pattern 2: Look for section headers with "Group X"
-        group_headers = soup.find_all(
-            string=re.compile(r"Group\s+[A-L]", re.IGNORECASE)
-        )
-        for header in group_headers:
-            match = re.search(r"Group\s+([A-L])", header, re.IGNORECASE)
-            if match:
-                group_letter = match.group(1).upper()
-                # Find the parent container and extract team names
-                parent = header.find_parent(["div", "section", "article"])
-                if parent:
-                    teams = self._extract_team_names(parent)
-                    if teams and len(teams) >= self.TEAMS_PER_GROUP:
-                        groups[group_letter] = teams[: self.TEAMS_PER_GROUP]
+        if _GROUP_HEADER_BYTES_RE.search(html) is not None:
+            group_headers = soup.find_all(string=_GROUP_HEADER_RE)
+            for header in group_headers:
+                match = _GROUP_HEADER_RE.search(header)
+                if match:
+                    group_letter = match.group(1).upper()
+                    # Find the parent container and extract team names
+                    parent = header.find_parent(["div", "section", "article"])
+                    if parent:
+                        teams = self._extract_team_names(parent)
+                        if teams and len(teams) >= self.TEAMS_PER_GROUP:
+                            groups[group_letter] = teams[: self.TEAMS_PER_GROUP]
 
         if len(groups) == len(self.GROUP_LETTERS):
             return groups
 
         # Pattern 3: Look for JSON-LD structured data
-        scripts = soup.find_all("script", type="application/ld+json")
-        for script in scripts:
-            try:
-                data = json.loads(script.string)
-                parsed = self._extract_groups_from_json_ld(data)
-                if parsed and len(parsed) == len(self.GROUP_LETTERS):
-                    return parsed
-            except (json.JSONDecodeError, TypeError):
-                continue
-
-        self.logger.debug(f"Could only parse {len(groups)} groups from teams page")
+        if b"ld+json" in html:
+            scripts = soup.find_all("script", type="application/ld+json")
+            for script in scripts:
+                try:
+                    data = json.loads(script.string)
+                    parsed = self._extract_groups_from_json_ld(data)
+                    if parsed and len(parsed) == len(self.GROUP_LETTERS):
+                        return parsed
+                except (json.JSONDecodeError, TypeError):
+                    continue
+
+        self.logger.debug("Could only parse %d groups from teams page", len(groups))
         return None if len(groups) < len(self.GROUP_LETTERS) else groups
 
-    def _parse_fifa_draw_page(self, html: str) -> dict[str, list[str]] | None:
+    def _parse_fifa_draw_page(self, html: bytes) -> dict[str, list[str]] | None:
         """Parse FIFA draw results page for group assignments.
 
         Args:
-            html: Raw HTML content from FIFA draw results page.
+            html: Raw HTML bytes from FIFA draw results page.
 
         Returns:
             Dictionary of groups or None if parsing fails.
         """
-        soup = BeautifulSoup(html, "lxml")
         groups: dict[str, list[str]] = {}
 
-        # Draw results pages often have tables or structured lists
-        # Look for table-based layouts
-        tables = soup.find_all("table")
-        for table in tables:
-            rows = table.find_all("tr")
-            for row in rows:
-                cells = row.find_all(["td", "th"])
+        # Draw results pages often have tables or structured lists. Only the
+        # table rows matter, so stream-parse with lxml's pull parser instead
+        # of building the whole document, stopping once all groups are found.
+        parser = etree.HTMLPullParser(events=("end",), tag="tr")
+        for start in range(0, len(html), 4096):
+            parser.feed(html[start : start + 4096])
+            for _event, row in parser.read_events():
+                cells = [c for c in row if c.tag in ("td", "th")]
                 if cells:
-                    first_cell = cells[0].get_text(strip=True)
-                    match = re.match(r"^Group\s+([A-L])$", first_cell, re.IGNORECASE)
+                    first_cell = "".join(cells[0].itertext()).strip()
+                    match = _GROUP_CELL_RE.match(first_cell)
                     if match:
                         group_letter = match.group(1).upper()
                         teams = [
-                            cell.get_text(strip=True)
+                            text
                             for cell in cells[1:]
-                            if cell.get_text(strip=True)
+                            if (text := "".join(cell.itertext()).strip())
                         ]
                         if len(teams) >= self.TEAMS_PER_GROUP:
                             groups[group_letter] = teams[: self.TEAMS_PER_GROUP]
+                # Drop inspected rows so memory stays bounded by one chunk
+                row.clear()
 
-        if len(groups) == len(self.GROUP_LETTERS):
-            return groups
+            if len(groups) == len(self.GROUP_LETTERS):
+                return groups
 
-        self.logger.debug(f"Could only parse {len(groups)} groups from draw page")
+        self.logger.debug("Could only parse %d groups from draw page", len(groups))
         return None if len(groups) < len(self.GROUP_LETTERS) else groups
 
     def _extract_team_names(self, element: Any) -> list[str]:
@@ -226,7 +258,7 @@ class GroupsScraper(BaseScraper):
 
         # Look for common patterns FIFA uses for team names
         # Pattern 1: Links with team names
-        team_links = element.find_all("a", href=re.compile(r"/team/"))
+        team_links = element.find_all("a", href=_TEAM_HREF_RE)
         for link in team_links:
             name = link.get_text(strip=True)
             if name and len(name) > 1:
@@ -236,12 +268,10 @@ class GroupsScraper(BaseScraper):
             return teams
 
         # Pattern 2: Elements with specific class patterns
-        team_elements = element.find_all(
-            class_=re.compile(r"team|country|nation", re.IGNORECASE)
-        )
+        team_elements = _TEAM_CLASS_SELECTOR.select(element)
         for elem in team_elements:
             name = elem.get_text(strip=True)
-            if name and len(name) > 1 and not re.match(r"^Group\s", name):
+            if name and len(name) > 1 and not _GROUP_PREFIX_RE.match(name):
                 teams.append(name)
 
         return teams
@@ -270,7 +300,7 @@ class GroupsScraper(BaseScraper):
                 if key in data:
                     nested = data[key]
                     if isinstance(nested, dict) and all(
-                        k in self.GROUP_LETTERS for k in nested.keys()
+                        k in self._GROUP_LETTER_SET for k in nested.keys()
                     ):
                         return nested
                     result = self._extract_groups_from_json_ld(nested)
@@ -282,6 +312,10 @@ class GroupsScraper(BaseScraper):
     def _load_from_team_mapping(self) -> dict[str, list[str]] | None:
         """Load groups data from team_mapping.json.
 
+        The parsed mapping is memoized per (path, mtime), so the repeat
+        reads from scrape and verify_against_mapping within one process
+        skip the re-parse until the file changes on disk.
+
         Returns:
             Dictionary of groups or None if file doesn't exist or has no groups.
         """
@@ -292,8 +326,10 @@ class GroupsScraper(BaseScraper):
             return None
 
         try:
-            with open(self._team_mapping_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _parse_team_mapping(
+                str(self._team_mapping_path),
+                self._team_mapping_path.stat().st_mtime,
+            )
 
             groups = data.get("groups")
             if not groups:
@@ -302,8 +338,8 @@ class GroupsScraper(BaseScraper):
 
             return groups
 
-        except (json.JSONDecodeError, IOError) as e:
-            self.logger.error(f"Error reading team_mapping.json: {e}")
+        except (jsonio.JSONDecodeError, OSError) as e:
+            self.logger.error("Error reading team_mapping.json: %s", e)
             return None
 
     def _validate_groups(self, groups: dict[str, list[str]]) -> bool:
@@ -316,10 +352,11 @@ class GroupsScraper(BaseScraper):
             True if valid, False otherwise.
         """
         # Check we have all 12 groups
-        if set(groups.keys()) != set(self.GROUP_LETTERS):
-            missing = set(self.GROUP_LETTERS) - set(groups.keys())
-            extra = set(groups.keys()) - set(self.GROUP_LETTERS)
-            self.logger.error(f"Invalid groups: missing={missing}, extra={extra}")
+        group_keys = set(groups.keys())
+        if group_keys != self._GROUP_LETTER_SET:
+            missing = self._GROUP_LETTER_SET - group_keys
+            extra = group_keys - self._GROUP_LETTER_SET
+            self.logger.error("Invalid groups: missing=%s, extra=%s", missing, extra)
             return False
 
         # Check each group has 4 teams
@@ -335,15 +372,16 @@ class GroupsScraper(BaseScraper):
         for teams in groups.values():
             all_teams.extend(teams)
 
-        if len(all_teams) != len(set(all_teams)):
-            duplicates = [t for t in all_teams if all_teams.count(t) > 1]
-            self.logger.error(f"Duplicate teams found: {set(duplicates)}")
+        unique_teams = set(all_teams)
+        if len(all_teams) != len(unique_teams):
+            duplicates = [t for t, c in Counter(all_teams).items() if c > 1]
+            self.logger.error("Duplicate teams found: %s", duplicates)
             return False
 
         # Should have 48 unique teams
-        if len(set(all_teams)) != 48:
+        if len(unique_teams) != 48:
             self.logger.error(
-                f"Expected 48 teams, found {len(set(all_teams))}"
+                f"Expected 48 teams, found {len(unique_teams)}"
             )
             return False
 
@@ -368,6 +406,15 @@ class GroupsScraper(BaseScraper):
             letter: groups[letter] for letter in self.GROUP_LETTERS
         }
 
+        # Tally both meta counters in one pass over the teams
+        total_teams = 0
+        tbd_spots = 0
+        for teams in ordered_groups.values():
+            total_teams += len(teams)
+            for team in teams:
+                if "TBD" in team or "Playoff" in team:
+                    tbd_spots += 1
+
         return {
             "groups": ordered_groups,
             "source": source,
@@ -375,13 +422,8 @@ class GroupsScraper(BaseScraper):
             "meta": {
                 "total_groups": len(ordered_groups),
                 "teams_per_group": self.TEAMS_PER_GROUP,
-                "total_teams": sum(len(t) for t in ordered_groups.values()),
-                "tbd_spots": sum(
-                    1
-                    for teams in ordered_groups.values()
-                    for team in teams
-                    if "TBD" in team or "Playoff" in team
-                ),
+                "total_teams": total_teams,
+                "tbd_spots": tbd_spots,
             },
         }
 
@@ -404,21 +446,31 @@ class GroupsScraper(BaseScraper):
         if not scraped or not mapping:
             return result
 
-        # Compare groups
+        # Compare groups on sets built once up front; sorted lists keep the
+        # reported differences deterministic across runs
+        scraped_sets = {
+            letter: frozenset(scraped.get(letter, ()))
+            for letter in self.GROUP_LETTERS
+        }
+        mapping_sets = {
+            letter: frozenset(mapping.get(letter, ()))
+            for letter in self.GROUP_LETTERS
+        }
+
         result["match"] = True
         for letter in self.GROUP_LETTERS:
-            scraped_teams = set(scraped.get(letter, []))
-            mapping_teams = set(mapping.get(letter, []))
+            scraped_teams = scraped_sets[letter]
+            mapping_teams = mapping_sets[letter]
 
             if scraped_teams != mapping_teams:
                 result["match"] = False
                 result["differences"].append(
                     {
                         "group": letter,
-                        "scraped": list(scraped_teams),
-                        "mapping": list(mapping_teams),
-                        "only_in_scraped": list(scraped_teams - mapping_teams),
-                        "only_in_mapping": list(mapping_teams - scraped_teams),
+                        "scraped": sorted(scraped_teams),
+                        "mapping": sorted(mapping_teams),
+                        "only_in_scraped": sorted(scraped_teams - mapping_teams),
+                        "only_in_mapping": sorted(mapping_teams - scraped_teams),
                     }
                 )
 
@@ -1,12 +1,127 @@
 """FIFA World Cup 2026 schedule scraper."""
 
-import json
+import re
+import sys
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import count
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Iterator
 
+from ..utils import jsonio
 from .base import BaseScraper
 
+# Bound once so timestamping skips the attribute-chain resolution per call
+_utcnow = datetime.now
+_UTC = timezone.utc
+
+# Alias sources probed when loading the team mapping, and a shared empty
+# dict reused for teams without an "aliases" entry so each miss doesn't
+# allocate a fresh default
+_ALIAS_KEYS = ("fifa", "elo", "transfermarkt", "sofascore")
+_EMPTY: dict = {}
+
+
+def _build_venue_token_index(venue_map: dict[str, str]) -> dict[str, str]:
+    """Map unambiguous venue-name tokens to venue ids.
+
+    Tokens shared by venues with different ids (e.g. "stadium") are
+    dropped so a probe can never resolve to the wrong venue.
+
+    Args:
+        venue_map: Mapping of venue display names to venue ids.
+
+    Returns:
+        Dict from lowercased token to venue id.
+    """
+    index: dict[str, str] = {}
+    ambiguous: set[str] = set()
+    for name, venue_id in venue_map.items():
+        for token in name.lower().split():
+            if index.setdefault(token, venue_id) != venue_id:
+                ambiguous.add(token)
+    for token in ambiguous:
+        del index[token]
+    return index
+
+
+@lru_cache(maxsize=128)
+def _slugify(name: str) -> str:
+    """Lower and underscore a name for the unknown-value fallbacks, memoized.
+
+    Unknown venues and rounds tend to repeat within a scrape, so the
+    slug is built once per distinct input.
+
+    Args:
+        name: Raw name to slugify.
+
+    Returns:
+        Lowercased name with spaces replaced by underscores.
+    """
+    return name.lower().replace(" ", "_")
+
+
+@lru_cache(maxsize=256)
+def _canonical_round(round_lower: str) -> str | None:
+    """Resolve a lowered round name to its normalized value, memoized.
+
+    The input domain is small and the lookup tables are constants, so
+    repeat calls collapse to one cache probe.
+
+    Args:
+        round_lower: Lowercased, stripped round name.
+
+    Returns:
+        Normalized round type, or None if nothing matched.
+    """
+    value = ScheduleScraper.ROUND_MAP.get(round_lower)
+    if value is not None:
+        return value
+    match = ScheduleScraper._ROUND_REGEX.search(round_lower)
+    if match:
+        return ScheduleScraper._ROUND_GROUP_TO_VALUE[match.lastgroup]
+    return None
+
+
+@lru_cache(maxsize=256)
+def _canonical_venue(venue_name: str) -> str | None:
+    """Resolve a raw venue name to its venue id, memoized.
+
+    Args:
+        venue_name: Raw venue name as scraped.
+
+    Returns:
+        Venue id, or None if nothing matched.
+    """
+    cls = ScheduleScraper
+    venue_id = cls.VENUE_ID_MAP.get(venue_name)
+    if venue_id is not None:
+        return venue_id
+
+    venue_lower = venue_name.lower()
+    venue_id = cls._VENUE_ID_MAP_LOWER.get(venue_lower)
+    if venue_id is not None:
+        return venue_id
+
+    for token in venue_lower.split():
+        venue_id = cls._VENUE_TOKEN_INDEX.get(token)
+        if venue_id is not None:
+            return venue_id
+
+    # Last-resort substring scan. A match in either direction needs a
+    # known venue's first word in the input, or the input's first word
+    # to open a known name, so anything else rejects without the scan.
+    if venue_lower.split(" ", 1)[0] in cls._VENUE_FIRSTWORDS or any(
+        word in venue_lower for word in cls._VENUE_FIRSTWORDS
+    ):
+        for name_lower, venue_id in cls._VENUE_ID_MAP_LOWER.items():
+            if name_lower in venue_lower or venue_lower in name_lower:
+                return venue_id
+
+    return None
+
 
 class ScheduleScraper(BaseScraper):
     """Scraper for FIFA World Cup 2026 match schedule.
@@ -17,8 +132,9 @@ class ScheduleScraper(BaseScraper):
 
     SCHEDULE_URL = "https://www.fifa.com/fifaplus/en/tournaments/mens/worldcup/canadamexicousa2026/match-centre"
 
-    # Mapping from FIFA venue names to our venue IDs
-    VENUE_ID_MAP = {
+    # Mapping from FIFA venue names to our venue IDs. Read-only in
+    # practice, so frozen as a proxy (the memoized lookups rely on it)
+    VENUE_ID_MAP = MappingProxyType({
         "MetLife Stadium": "metlife",
         "AT&T Stadium": "att",
         "Mercedes-Benz Stadium": "mercedes_benz",
@@ -36,10 +152,23 @@ class ScheduleScraper(BaseScraper):
         "Estadio Azteca": "azteca",
         "Estadio BBVA": "bbva",
         "Estadio Akron": "akron",
-    }
+    })
+
+    # Lowercase-keyed view built once so case-insensitive lookups are a
+    # single dict probe instead of a scan that re-lowers every key
+    _VENUE_ID_MAP_LOWER = {name.lower(): vid for name, vid in VENUE_ID_MAP.items()}
+
+    # Unambiguous venue-name tokens, indexed once for the partial-match path
+    _VENUE_TOKEN_INDEX = _build_venue_token_index(VENUE_ID_MAP)
 
-    # Round type mapping
-    ROUND_MAP = {
+    # First words of the known venue names; the substring fallback uses
+    # this to bail out on inputs that can't open or contain a known name
+    _VENUE_FIRSTWORDS = frozenset(
+        name.split(" ", 1)[0] for name in _VENUE_ID_MAP_LOWER
+    )
+
+    # Round type mapping, frozen like VENUE_ID_MAP
+    ROUND_MAP = MappingProxyType({
         "group stage": "group_stage",
         "group": "group_stage",
         "round of 32": "round_of_32",
@@ -54,7 +183,18 @@ class ScheduleScraper(BaseScraper):
         "3rd place": "third_place",
         "third-place play-off": "third_place",
         "final": "final",
-    }
+    })
+
+    # One alternation compiled over the round patterns; a single scan
+    # replaces the per-pattern substring loop on the fallback path
+    _ROUND_REGEX = re.compile(
+        "|".join(f"(?P<g{i}>{re.escape(p)})" for i, p in enumerate(ROUND_MAP))
+    )
+    _ROUND_GROUP_TO_VALUE = {f"g{i}": v for i, v in enumerate(ROUND_MAP.values())}
+
+    # Generated schedule, cached per class after the first build; the
+    # inputs are constants so the 104-match list never changes
+    _CACHED_SCHEDULE: list[dict[str, Any]] | None = None
 
     def __init__(self, output_dir: Path, team_mapping_path: Path | None = None) -> None:
         """Initialize the schedule scraper.
@@ -66,6 +206,9 @@ class ScheduleScraper(BaseScraper):
         super().__init__(output_dir)
         self.team_mapping_path = team_mapping_path
         self.team_name_to_id: dict[str, int] = {}
+        # Memoized _resolve_team_id results, keyed on the raw name so
+        # repeat hits skip the .lower() allocation entirely
+        self._resolve_cache: dict[str, int | None] = {}
         self._load_team_mapping()
 
     def _load_team_mapping(self) -> None:
@@ -75,23 +218,25 @@ class ScheduleScraper(BaseScraper):
             return
 
         try:
-            with open(self.team_mapping_path, "r", encoding="utf-8") as f:
-                mapping = json.load(f)
+            mapping = jsonio.loads(self.team_mapping_path.read_bytes())
 
+            name_to_id = self.team_name_to_id
             for team in mapping.get("teams", []):
                 team_id = team.get("id")
                 canonical = team.get("canonical_name", "")
                 if team_id is not None and canonical:
-                    self.team_name_to_id[canonical.lower()] = team_id
-                    # Also add common aliases
-                    for alias_key in ["fifa", "elo", "transfermarkt", "sofascore"]:
-                        alias = team.get("aliases", {}).get(alias_key)
-                        if alias and alias != "TBD":
-                            self.team_name_to_id[alias.lower()] = team_id
-
-            self.logger.info(f"Loaded {len(self.team_name_to_id)} team name mappings")
+                    name_to_id[canonical.lower()] = team_id
+                    # Also add common aliases, probed in one pass
+                    aliases = team.get("aliases") or _EMPTY
+                    name_to_id.update(
+                        (alias.lower(), team_id)
+                        for key in _ALIAS_KEYS
+                        if (alias := aliases.get(key)) and alias != "TBD"
+                    )
+
+            self.logger.info("Loaded %d team name mappings", len(name_to_id))
         except Exception as e:
-            self.logger.error(f"Failed to load team mapping: {e}")
+            self.logger.error("Failed to load team mapping: %s", e)
 
     def get_output_filename(self) -> str:
         """Get the output filename for this scraper."""
@@ -115,7 +260,7 @@ class ScheduleScraper(BaseScraper):
 
         return {
             "matches": matches,
-            "lastUpdated": datetime.now(timezone.utc).isoformat(),
+            "lastUpdated": _utcnow(_UTC).isoformat(),
             "source": "static_generation",
             "tournament": "FIFA World Cup 2026",
         }
@@ -132,23 +277,35 @@ class ScheduleScraper(BaseScraper):
         - Third place play-off (1 match)
         - Final (1 match)
         Total: 104 matches
-        """
-        matches = []
-        match_number = 1
 
-        # Group stage schedule (based on official FIFA schedule)
-        # Dates: June 11-28, 2026
-        group_schedule = self._generate_group_stage_schedule()
-        for match in group_schedule:
-            match["matchNumber"] = match_number
-            matches.append(match)
-            match_number += 1
-
-        # Knockout stage schedule
-        knockout_schedule = self._generate_knockout_schedule(match_number)
-        matches.extend(knockout_schedule)
-
-        return matches
+        The inputs are constants, so the list is built once and cached on
+        the class; subsequent calls return fresh copies of the cached
+        matches instead of re-running the generation.
+        """
+        cls = type(self)
+        if cls._CACHED_SCHEDULE is None:
+            cls._CACHED_SCHEDULE = list(self._iter_static_schedule())
+
+        # The match dicts are flat, so per-dict copies are a full deep copy
+        return [dict(match) for match in cls._CACHED_SCHEDULE]
+
+    def _iter_static_schedule(self) -> "Iterator[dict[str, Any]]":
+        """Yield the full schedule one match at a time.
+
+        Group-stage matches are numbered lazily as they are yielded
+        (dates June 11-28, 2026); knockout templates already carry their
+        bracket match numbers. Callers that need the whole schedule
+        materialize it with list(), but the generator lets anything that
+        stops early (or streams the matches out) avoid building all 104
+        dicts up front.
+        """
+        numbers = count(1)
+        for template in self._GROUP_STAGE_TEMPLATES:
+            match = dict(template)
+            match["matchNumber"] = next(numbers)
+            yield match
+        for template in self._KNOCKOUT_TEMPLATES:
+            yield dict(template)
 
     # Official FIFA World Cup 2026 Group Stage Schedule
     # Source: https://www.mlssoccer.com/news/fifa-world-cup-2026-schedule-every-game-by-city-stadium
@@ -169,171 +326,193 @@ class ScheduleScraper(BaseScraper):
     # J: Argentina (J1), Algeria (J2), Austria (J3), Jordan (J4)
     # K: Portugal (K1), Colombia (K2), Uzbekistan (K3), Intercontinental Playoff 1 (K4)
     # L: England (L1), Croatia (L2), Ghana (L3), Panama (L4)
-    GROUP_STAGE_MATCHES = [
+    # Rows are (date, time, venueId, groupId, home, away) tuples -- a
+    # compact column layout instead of 73 per-row dicts
+    _GS_ROWS = (
         # June 11 - Opening Day
         # Mexico City: Mexico vs South Africa (Group A) - Opening Match at 3:00 PM ET
-        {"date": "2026-06-11", "time": "15:00", "venueId": "azteca", "groupId": "A", "home": "A1", "away": "A2"},
+        ("2026-06-11", "15:00", "azteca", "A", "A1", "A2"),
         # Guadalajara: South Korea vs UEFA Playoff D (Group A) - 10:00 PM ET
-        {"date": "2026-06-11", "time": "22:00", "venueId": "akron", "groupId": "A", "home": "A3", "away": "A4"},
+        ("2026-06-11", "22:00", "akron", "A", "A3", "A4"),
         # June 12
         # Toronto: Canada vs UEFA Playoff A (Group B)
-        {"date": "2026-06-12", "time": "15:00", "venueId": "bmo", "groupId": "B", "home": "B1", "away": "B2"},
+        ("2026-06-12", "15:00", "bmo", "B", "B1", "B2"),
         # Los Angeles: USA vs Paraguay (Group D)
-        {"date": "2026-06-12", "time": "21:00", "venueId": "sofi", "groupId": "D", "home": "D1", "away": "D2"},
+        ("2026-06-12", "21:00", "sofi", "D", "D1", "D2"),
         # June 13
         # Boston: Haiti vs Scotland (Group C)
-        {"date": "2026-06-13", "time": "21:00", "venueId": "gillette", "groupId": "C", "home": "C3", "away": "C4"},
+        ("2026-06-13", "21:00", "gillette", "C", "C3", "C4"),
         # New York/New Jersey: Brazil vs Morocco (Group C)
-        {"date": "2026-06-13", "time": "18:00", "venueId": "metlife", "groupId": "C", "home": "C1", "away": "C2"},
+        ("2026-06-13", "18:00", "metlife", "C", "C1", "C2"),
         # San Francisco: Qatar vs Switzerland (Group B)
-        {"date": "2026-06-13", "time": "15:00", "venueId": "levis", "groupId": "B", "home": "B3", "away": "B4"},
+        ("2026-06-13", "15:00", "levis", "B", "B3", "B4"),
         # Vancouver: Australia vs UEFA Playoff C (Group D)
-        {"date": "2026-06-14", "time": "00:00", "venueId": "bc_place", "groupId": "D", "home": "D3", "away": "D4"},
+        ("2026-06-14", "00:00", "bc_place", "D", "D3", "D4"),
         # June 14
         # Houston: Germany vs Curaçao (Group E)
-        {"date": "2026-06-14", "time": "13:00", "venueId": "nrg", "groupId": "E", "home": "E1", "away": "E2"},
+        ("2026-06-14", "13:00", "nrg", "E", "E1", "E2"),
         # Philadelphia: Ivory Coast vs Ecuador (Group E)
-        {"date": "2026-06-14", "time": "19:00", "venueId": "lincoln_financial", "groupId": "E", "home": "E3", "away": "E4"},
+        ("2026-06-14", "19:00", "lincoln_financial", "E", "E3", "E4"),
         # Dallas: Netherlands vs Japan (Group F)
-        {"date": "2026-06-14", "time": "16:00", "venueId": "att", "groupId": "F", "home": "F1", "away": "F2"},
+        ("2026-06-14", "16:00", "att", "F", "F1", "F2"),
         # Monterrey: UEFA Playoff B vs Tunisia (Group F) - 10:00 PM ET
-        {"date": "2026-06-14", "time": "22:00", "venueId": "bbva", "groupId": "F", "home": "F3", "away": "F4"},
+        ("2026-06-14", "22:00", "bbva", "F", "F3", "F4"),
         # June 15
         # Atlanta: Spain vs Cape Verde (Group H)
-        {"date": "2026-06-15", "time": "12:00", "venueId": "mercedes_benz", "groupId": "H", "home": "H1", "away": "H2"},
+        ("2026-06-15", "12:00", "mercedes_benz", "H", "H1", "H2"),
         # Miami: Saudi Arabia vs Uruguay (Group H)
-        {"date": "2026-06-15", "time": "18:00", "venueId": "hard_rock", "groupId": "H", "home": "H3", "away": "H4"},
+        ("2026-06-15", "18:00", "hard_rock", "H", "H3", "H4"),
         # Seattle: Belgium vs Egypt (Group G)
-        {"date": "2026-06-15", "time": "15:00", "venueId": "lumen", "groupId": "G", "home": "G1", "away": "G2"},
+        ("2026-06-15", "15:00", "lumen", "G", "G1", "G2"),
         # Los Angeles: Iran vs New Zealand (Group G)
-        {"date": "2026-06-15", "time": "21:00", "venueId": "sofi", "groupId": "G", "home": "G3", "away": "G4"},
+        ("2026-06-15", "21:00", "sofi", "G", "G3", "G4"),
         # June 16
         # Boston: Intercontinental Playoff 2 vs Norway (Group I)
-        {"date": "2026-06-16", "time": "18:00", "venueId": "gillette", "groupId": "I", "home": "I3", "away": "I4"},
+        ("2026-06-16", "18:00", "gillette", "I", "I3", "I4"),
         # New York/New Jersey: France vs Senegal (Group I)
-        {"date": "2026-06-16", "time": "15:00", "venueId": "metlife", "groupId": "I", "home": "I1", "away": "I2"},
+        ("2026-06-16", "15:00", "metlife", "I", "I1", "I2"),
         # San Francisco: Austria vs Jordan (Group J)
-        {"date": "2026-06-17", "time": "00:00", "venueId": "levis", "groupId": "J", "home": "J3", "away": "J4"},
+        ("2026-06-17", "00:00", "levis", "J", "J3", "J4"),
         # Kansas City: Argentina vs Algeria (Group J)
-        {"date": "2026-06-16", "time": "21:00", "venueId": "arrowhead", "groupId": "J", "home": "J1", "away": "J2"},
+        ("2026-06-16", "21:00", "arrowhead", "J", "J1", "J2"),
         # June 17
         # Mexico City: Uzbekistan vs Colombia (Group K) at 10:00 PM ET
-        {"date": "2026-06-17", "time": "22:00", "venueId": "azteca", "groupId": "K", "home": "K3", "away": "K4"},
+        ("2026-06-17", "22:00", "azteca", "K", "K3", "K4"),
         # Houston: Portugal vs Intercontinental Playoff 1 (Group K)
-        {"date": "2026-06-17", "time": "13:00", "venueId": "nrg", "groupId": "K", "home": "K1", "away": "K2"},
+        ("2026-06-17", "13:00", "nrg", "K", "K1", "K2"),
         # Toronto: Ghana vs Panama (Group L)
-        {"date": "2026-06-17", "time": "19:00", "venueId": "bmo", "groupId": "L", "home": "L3", "away": "L4"},
+        ("2026-06-17", "19:00", "bmo", "L", "L3", "L4"),
         # Dallas: England vs Croatia (Group L)
-        {"date": "2026-06-17", "time": "16:00", "venueId": "att", "groupId": "L", "home": "L1", "away": "L2"},
+        ("2026-06-17", "16:00", "att", "L", "L1", "L2"),
         # June 18 - Matchday 2 begins
         # Atlanta: UEFA Playoff D vs South Africa (Group A)
-        {"date": "2026-06-18", "time": "12:00", "venueId": "mercedes_benz", "groupId": "A", "home": "A4", "away": "A2"},
+        ("2026-06-18", "12:00", "mercedes_benz", "A", "A4", "A2"),
         # Guadalajara: Mexico vs South Korea (Group A) - 9:00 PM ET
-        {"date": "2026-06-18", "time": "21:00", "venueId": "akron", "groupId": "A", "home": "A1", "away": "A3"},
+        ("2026-06-18", "21:00", "akron", "A", "A1", "A3"),
         # Vancouver: Canada vs Qatar (Group B)
-        {"date": "2026-06-18", "time": "18:00", "venueId": "bc_place", "groupId": "B", "home": "B1", "away": "B3"},
+        ("2026-06-18", "18:00", "bc_place", "B", "B1", "B3"),
         # Los Angeles: Switzerland vs UEFA Playoff A (Group B)
-        {"date": "2026-06-18", "time": "15:00", "venueId": "sofi", "groupId": "B", "home": "B4", "away": "B2"},
+        ("2026-06-18", "15:00", "sofi", "B", "B4", "B2"),
         # June 19
         # Boston: Scotland vs Morocco (Group C)
-        {"date": "2026-06-19", "time": "18:00", "venueId": "gillette", "groupId": "C", "home": "C4", "away": "C2"},
+        ("2026-06-19", "18:00", "gillette", "C", "C4", "C2"),
         # Philadelphia: Brazil vs Haiti (Group C)
-        {"date": "2026-06-19", "time": "21:00", "venueId": "lincoln_financial", "groupId": "C", "home": "C1", "away": "C3"},
+        ("2026-06-19", "21:00", "lincoln_financial", "C", "C1", "C3"),
         # Seattle: USA vs Australia (Group D)
-        {"date": "2026-06-19", "time": "15:00", "venueId": "lumen", "groupId": "D", "home": "D1", "away": "D3"},
+        ("2026-06-19", "15:00", "lumen", "D", "D1", "D3"),
         # San Francisco: UEFA Playoff C vs Paraguay (Group D)
-        {"date": "2026-06-20", "time": "00:00", "venueId": "levis", "groupId": "D", "home": "D4", "away": "D2"},
+        ("2026-06-20", "00:00", "levis", "D", "D4", "D2"),
         # June 20
         # Kansas City: Ecuador vs Curaçao (Group E)
-        {"date": "2026-06-20", "time": "20:00", "venueId": "arrowhead", "groupId": "E", "home": "E4", "away": "E2"},
+        ("2026-06-20", "20:00", "arrowhead", "E", "E4", "E2"),
         # Toronto: Germany vs Ivory Coast (Group E)
-        {"date": "2026-06-20", "time": "16:00", "venueId": "bmo", "groupId": "E", "home": "E1", "away": "E3"},
+        ("2026-06-20", "16:00", "bmo", "E", "E1", "E3"),
         # Houston: Netherlands vs UEFA Playoff B (Group F)
-        {"date": "2026-06-20", "time": "13:00", "venueId": "nrg", "groupId": "F", "home": "F1", "away": "F3"},
+        ("2026-06-20", "13:00", "nrg", "F", "F1", "F3"),
         # Monterrey: Tunisia vs Japan (Group F) - 1000th FIFA World Cup match - 12:00 AM ET (midnight)
-        {"date": "2026-06-21", "time": "00:00", "venueId": "bbva", "groupId": "F", "home": "F4", "away": "F2"},
+        ("2026-06-21", "00:00", "bbva", "F", "F4", "F2"),
         # June 21
         # Atlanta: Spain vs Saudi Arabia (Group H)
-        {"date": "2026-06-21", "time": "12:00", "venueId": "mercedes_benz", "groupId": "H", "home": "H1", "away": "H3"},
+        ("2026-06-21", "12:00", "mercedes_benz", "H", "H1", "H3"),
         # Miami: Uruguay vs Cape Verde (Group H)
-        {"date": "2026-06-21", "time": "18:00", "venueId": "hard_rock", "groupId": "H", "home": "H4", "away": "H2"},
+        ("2026-06-21", "18:00", "hard_rock", "H", "H4", "H2"),
         # Los Angeles: Belgium vs Iran (Group G)
-        {"date": "2026-06-21", "time": "15:00", "venueId": "sofi", "groupId": "G", "home": "G1", "away": "G3"},
+        ("2026-06-21", "15:00", "sofi", "G", "G1", "G3"),
         # Vancouver: New Zealand vs Egypt (Group G)
-        {"date": "2026-06-21", "time": "21:00", "venueId": "bc_place", "groupId": "G", "home": "G4", "away": "G2"},
+        ("2026-06-21", "21:00", "bc_place", "G", "G4", "G2"),
         # June 22
         # Philadelphia: France vs Intercontinental Playoff 2 (Group I)
-        {"date": "2026-06-22", "time": "17:00", "venueId": "lincoln_financial", "groupId": "I", "home": "I1", "away": "I3"},
+        ("2026-06-22", "17:00", "lincoln_financial", "I", "I1", "I3"),
         # New York/New Jersey: Norway vs Senegal (Group I)
-        {"date": "2026-06-22", "time": "20:00", "venueId": "metlife", "groupId": "I", "home": "I4", "away": "I2"},
+        ("2026-06-22", "20:00", "metlife", "I", "I4", "I2"),
         # Dallas: Argentina vs Austria (Group J)
-        {"date": "2026-06-22", "time": "13:00", "venueId": "att", "groupId": "J", "home": "J1", "away": "J3"},
+        ("2026-06-22", "13:00", "att", "J", "J1", "J3"),
         # San Francisco: Jordan vs Algeria (Group J)
-        {"date": "2026-06-22", "time": "23:00", "venueId": "levis", "groupId": "J", "home": "J4", "away": "J2"},
+        ("2026-06-22", "23:00", "levis", "J", "J4", "J2"),
         # June 23
         # Houston: Portugal vs Uzbekistan (Group K)
-        {"date": "2026-06-23", "time": "13:00", "venueId": "nrg", "groupId": "K", "home": "K1", "away": "K3"},
+        ("2026-06-23", "13:00", "nrg", "K", "K1", "K3"),
         # Guadalajara: Colombia vs Intercontinental Playoff 1 (Group K) - 10:00 PM ET
-        {"date": "2026-06-23", "time": "22:00", "venueId": "akron", "groupId": "K", "home": "K4", "away": "K2"},
+        ("2026-06-23", "22:00", "akron", "K", "K4", "K2"),
         # Boston: England vs Ghana (Group L)
-        {"date": "2026-06-23", "time": "16:00", "venueId": "gillette", "groupId": "L", "home": "L1", "away": "L3"},
+        ("2026-06-23", "16:00", "gillette", "L", "L1", "L3"),
         # Toronto: Panama vs Croatia (Group L)
-        {"date": "2026-06-23", "time": "19:00", "venueId": "bmo", "groupId": "L", "home": "L4", "away": "L2"},
+        ("2026-06-23", "19:00", "bmo", "L", "L4", "L2"),
         # June 24 - Matchday 3 begins (final group stage matches, simultaneous kickoffs)
         # Mexico City: UEFA Playoff D vs Mexico (Group A) at 9:00 PM ET
-        {"date": "2026-06-24", "time": "21:00", "venueId": "azteca", "groupId": "A", "home": "A4", "away": "A1"},
+        ("2026-06-24", "21:00", "azteca", "A", "A4", "A1"),
         # Monterrey: South Africa vs South Korea (Group A) - 9:00 PM ET
-        {"date": "2026-06-24", "time": "21:00", "venueId": "bbva", "groupId": "A", "home": "A2", "away": "A3"},
+        ("2026-06-24", "21:00", "bbva", "A", "A2", "A3"),
         # Los Angeles: UEFA Playoff A vs Qatar (Group B)
-        {"date": "2026-06-24", "time": "21:00", "venueId": "sofi", "groupId": "B", "home": "B2", "away": "B3"},
+        ("2026-06-24", "21:00", "sofi", "B", "B2", "B3"),
         # Vancouver: Switzerland vs Canada (Group B)
-        {"date": "2026-06-24", "time": "15:00", "venueId": "bc_place", "groupId": "B", "home": "B4", "away": "B1"},
+        ("2026-06-24", "15:00", "bc_place", "B", "B4", "B1"),
         # Seattle: UEFA Playoff A vs Qatar (Group B)
-        {"date": "2026-06-24", "time": "15:00", "venueId": "lumen", "groupId": "B", "home": "B2", "away": "B3"},
+        ("2026-06-24", "15:00", "lumen", "B", "B2", "B3"),
         # Atlanta: Morocco vs Haiti (Group C)
-        {"date": "2026-06-24", "time": "18:00", "venueId": "mercedes_benz", "groupId": "C", "home": "C2", "away": "C3"},
+        ("2026-06-24", "18:00", "mercedes_benz", "C", "C2", "C3"),
         # Miami: Scotland vs Brazil (Group C)
-        {"date": "2026-06-24", "time": "18:00", "venueId": "hard_rock", "groupId": "C", "home": "C4", "away": "C1"},
+        ("2026-06-24", "18:00", "hard_rock", "C", "C4", "C1"),
         # June 25
         # Los Angeles: UEFA Playoff C vs USA (Group D)
-        {"date": "2026-06-25", "time": "22:00", "venueId": "sofi", "groupId": "D", "home": "D4", "away": "D1"},
+        ("2026-06-25", "22:00", "sofi", "D", "D4", "D1"),
         # San Francisco: Paraguay vs Australia (Group D)
-        {"date": "2026-06-25", "time": "22:00", "venueId": "levis", "groupId": "D", "home": "D2", "away": "D3"},
+        ("2026-06-25", "22:00", "levis", "D", "D2", "D3"),
         # New York/New Jersey: Ecuador vs Germany (Group E)
-        {"date": "2026-06-25", "time": "16:00", "venueId": "metlife", "groupId": "E", "home": "E4", "away": "E1"},
+        ("2026-06-25", "16:00", "metlife", "E", "E4", "E1"),
         # Philadelphia: Curaçao vs Ivory Coast (Group E)
-        {"date": "2026-06-25", "time": "16:00", "venueId": "lincoln_financial", "groupId": "E", "home": "E2", "away": "E3"},
+        ("2026-06-25", "16:00", "lincoln_financial", "E", "E2", "E3"),
         # Dallas: Japan vs UEFA Playoff B (Group F)
-        {"date": "2026-06-25", "time": "19:00", "venueId": "att", "groupId": "F", "home": "F2", "away": "F3"},
+        ("2026-06-25", "19:00", "att", "F", "F2", "F3"),
         # Kansas City: Tunisia vs Netherlands (Group F)
-        {"date": "2026-06-25", "time": "19:00", "venueId": "arrowhead", "groupId": "F", "home": "F4", "away": "F1"},
+        ("2026-06-25", "19:00", "arrowhead", "F", "F4", "F1"),
         # June 26
         # Seattle: Egypt vs Iran (Group G)
-        {"date": "2026-06-26", "time": "23:00", "venueId": "lumen", "groupId": "G", "home": "G2", "away": "G3"},
+        ("2026-06-26", "23:00", "lumen", "G", "G2", "G3"),
         # Vancouver: New Zealand vs Belgium (Group G)
-        {"date": "2026-06-26", "time": "23:00", "venueId": "bc_place", "groupId": "G", "home": "G4", "away": "G1"},
+        ("2026-06-26", "23:00", "bc_place", "G", "G4", "G1"),
         # Guadalajara: Uruguay vs Spain (Group H) - 8:00 PM ET
-        {"date": "2026-06-26", "time": "20:00", "venueId": "akron", "groupId": "H", "home": "H4", "away": "H1"},
+        ("2026-06-26", "20:00", "akron", "H", "H4", "H1"),
         # Houston: Cape Verde vs Saudi Arabia (Group H)
-        {"date": "2026-06-26", "time": "20:00", "venueId": "nrg", "groupId": "H", "home": "H2", "away": "H3"},
+        ("2026-06-26", "20:00", "nrg", "H", "H2", "H3"),
         # Toronto: Senegal vs Intercontinental Playoff 2 (Group I)
-        {"date": "2026-06-26", "time": "15:00", "venueId": "bmo", "groupId": "I", "home": "I2", "away": "I3"},
+        ("2026-06-26", "15:00", "bmo", "I", "I2", "I3"),
         # Boston: Norway vs France (Group I)
-        {"date": "2026-06-26", "time": "15:00", "venueId": "gillette", "groupId": "I", "home": "I4", "away": "I1"},
+        ("2026-06-26", "15:00", "gillette", "I", "I4", "I1"),
         # June 27 - Final group stage day
         # Atlanta: Intercontinental Playoff 1 vs Uzbekistan (Group K)
-        {"date": "2026-06-27", "time": "19:30", "venueId": "mercedes_benz", "groupId": "K", "home": "K2", "away": "K3"},
+        ("2026-06-27", "19:30", "mercedes_benz", "K", "K2", "K3"),
         # Miami: Colombia vs Portugal (Group K)
-        {"date": "2026-06-27", "time": "19:30", "venueId": "hard_rock", "groupId": "K", "home": "K4", "away": "K1"},
+        ("2026-06-27", "19:30", "hard_rock", "K", "K4", "K1"),
         # Dallas: Jordan vs Argentina (Group J)
-        {"date": "2026-06-27", "time": "22:00", "venueId": "att", "groupId": "J", "home": "J4", "away": "J1"},
+        ("2026-06-27", "22:00", "att", "J", "J4", "J1"),
         # Kansas City: Algeria vs Austria (Group J)
-        {"date": "2026-06-27", "time": "22:00", "venueId": "arrowhead", "groupId": "J", "home": "J2", "away": "J3"},
+        ("2026-06-27", "22:00", "arrowhead", "J", "J2", "J3"),
         # New York/New Jersey: Panama vs England (Group L)
-        {"date": "2026-06-27", "time": "17:00", "venueId": "metlife", "groupId": "L", "home": "L4", "away": "L1"},
+        ("2026-06-27", "17:00", "metlife", "L", "L4", "L1"),
         # Philadelphia: Croatia vs Ghana (Group L)
-        {"date": "2026-06-27", "time": "17:00", "venueId": "lincoln_financial", "groupId": "L", "home": "L2", "away": "L3"},
-    ]
+        ("2026-06-27", "17:00", "lincoln_financial", "L", "L2", "L3"),
+    )
+
+    # Output-shaped group stage rows, renamed and sorted by (date, time)
+    # once at class-definition time so runtime only shallow-copies them
+    # Values repeat heavily across the 104 matches (venues, dates, group
+    # ids), so they are interned: copies share one string object and
+    # downstream equality checks reduce to pointer compares
+    _GROUP_STAGE_TEMPLATES = tuple(
+        {
+            "date": sys.intern(date),
+            "time": sys.intern(time),
+            "venueId": sys.intern(venue_id),
+            "round": "group_stage",
+            "groupId": sys.intern(group_id),
+            "homePlaceholder": sys.intern(home),
+            "awayPlaceholder": sys.intern(away),
+        }
+        for date, time, venue_id, group_id, home, away in sorted(
+            _GS_ROWS, key=itemgetter(0, 1)
+        )
+    )
 
     def _generate_group_stage_schedule(self) -> list[dict[str, Any]]:
         """Generate group stage match schedule from official FIFA data.
@@ -341,153 +520,96 @@ class ScheduleScraper(BaseScraper):
         Each group has 6 matches (round-robin of 4 teams).
         12 groups × 6 matches = 72 matches.
         Source: https://www.mlssoccer.com/news/fifa-world-cup-2026-schedule-every-game-by-city-stadium
-        """
-        matches = []
-
-        for match_data in self.GROUP_STAGE_MATCHES:
-            matches.append({
-                "date": match_data["date"],
-                "time": match_data["time"],
-                "venueId": match_data["venueId"],
-                "round": "group_stage",
-                "groupId": match_data["groupId"],
-                "homePlaceholder": match_data["home"],
-                "awayPlaceholder": match_data["away"],
-            })
-
-        # Sort by date and time
-        matches.sort(key=lambda m: (m["date"], m["time"]))
-
-        return matches
 
-    def _generate_knockout_schedule(self, start_match_number: int) -> list[dict[str, Any]]:
-        """Generate knockout stage schedule.
-
-        Args:
-            start_match_number: Starting match number for knockout stage.
+        The renaming and (date, time) sort happen once at class-definition
+        time; this only copies the precomputed templates.
         """
-        matches = []
-
+        return [dict(template) for template in self._GROUP_STAGE_TEMPLATES]
+
+    # Knockout fixtures as one parameterized table of
+    # (matchNumber, date, time, venueId, home, away) rows per round.
+    # Match numbers and pairings from official FIFA bracket (bracket.rs);
+    # W{matchNum}/L{matchNum} reference earlier match winners/losers.
+    # Order: by match number (which follows bracket position, not chronology).
+    _KNOCKOUT_SPECS = (
         # Round of 32 - June 29-July 2, 2026
-        # Match numbers and pairings from official FIFA bracket (bracket.rs).
-        # Order: by match number (which follows bracket position, not chronology).
-        r32_matches = [
-            {"matchNumber": 73,  "date": "2026-06-29", "time": "13:00", "venueId": "gillette",      "home": "2A", "away": "2B"},
-            {"matchNumber": 74,  "date": "2026-06-29", "time": "16:00", "venueId": "metlife",        "home": "1E", "away": "3A/B/C/D/F"},
-            {"matchNumber": 75,  "date": "2026-06-29", "time": "19:00", "venueId": "bbva",           "home": "1F", "away": "2C"},
-            {"matchNumber": 76,  "date": "2026-06-29", "time": "22:00", "venueId": "nrg",            "home": "1C", "away": "2F"},
-            {"matchNumber": 77,  "date": "2026-06-30", "time": "13:00", "venueId": "azteca",         "home": "1I", "away": "3C/D/F/G/H"},
-            {"matchNumber": 78,  "date": "2026-06-30", "time": "16:00", "venueId": "mercedes_benz",  "home": "2E", "away": "2I"},
-            {"matchNumber": 79,  "date": "2026-06-30", "time": "19:00", "venueId": "sofi",           "home": "1A", "away": "3C/E/F/H/I"},
-            {"matchNumber": 80,  "date": "2026-06-30", "time": "22:00", "venueId": "att",            "home": "1L", "away": "3E/H/I/J/K"},
-            {"matchNumber": 81,  "date": "2026-07-01", "time": "13:00", "venueId": "levis",          "home": "1D", "away": "3B/E/F/I/J"},
-            {"matchNumber": 82,  "date": "2026-07-01", "time": "16:00", "venueId": "lumen",          "home": "1G", "away": "3A/E/H/I/J"},
-            {"matchNumber": 83,  "date": "2026-07-01", "time": "19:00", "venueId": "sofi",           "home": "2K", "away": "2L"},
-            {"matchNumber": 84,  "date": "2026-07-01", "time": "22:00", "venueId": "hard_rock",      "home": "1H", "away": "2J"},
-            {"matchNumber": 85,  "date": "2026-07-02", "time": "13:00", "venueId": "bc_place",       "home": "1B", "away": "3E/F/G/I/J"},
-            {"matchNumber": 86,  "date": "2026-07-02", "time": "16:00", "venueId": "arrowhead",      "home": "1J", "away": "2H"},
-            {"matchNumber": 87,  "date": "2026-07-02", "time": "19:00", "venueId": "bmo",            "home": "1K", "away": "3D/E/I/J/L"},
-            {"matchNumber": 88,  "date": "2026-07-02", "time": "22:00", "venueId": "att",            "home": "2D", "away": "2G"},
-        ]
-
-        for m in r32_matches:
-            matches.append({
-                "matchNumber": m["matchNumber"],
-                "date": m["date"],
-                "time": m["time"],
-                "venueId": m["venueId"],
-                "round": "round_of_32",
-                "homePlaceholder": m["home"],
-                "awayPlaceholder": m["away"],
-            })
-
+        ("round_of_32", (
+            (73,  "2026-06-29", "13:00", "gillette",      "2A", "2B"),
+            (74,  "2026-06-29", "16:00", "metlife",       "1E", "3A/B/C/D/F"),
+            (75,  "2026-06-29", "19:00", "bbva",          "1F", "2C"),
+            (76,  "2026-06-29", "22:00", "nrg",           "1C", "2F"),
+            (77,  "2026-06-30", "13:00", "azteca",        "1I", "3C/D/F/G/H"),
+            (78,  "2026-06-30", "16:00", "mercedes_benz", "2E", "2I"),
+            (79,  "2026-06-30", "19:00", "sofi",          "1A", "3C/E/F/H/I"),
+            (80,  "2026-06-30", "22:00", "att",           "1L", "3E/H/I/J/K"),
+            (81,  "2026-07-01", "13:00", "levis",         "1D", "3B/E/F/I/J"),
+            (82,  "2026-07-01", "16:00", "lumen",         "1G", "3A/E/H/I/J"),
+            (83,  "2026-07-01", "19:00", "sofi",          "2K", "2L"),
+            (84,  "2026-07-01", "22:00", "hard_rock",     "1H", "2J"),
+            (85,  "2026-07-02", "13:00", "bc_place",      "1B", "3E/F/G/I/J"),
+            (86,  "2026-07-02", "16:00", "arrowhead",     "1J", "2H"),
+            (87,  "2026-07-02", "19:00", "bmo",           "1K", "3D/E/I/J/L"),
+            (88,  "2026-07-02", "22:00", "att",           "2D", "2G"),
+        )),
         # Round of 16 - July 4-7, 2026
-        # Pairings from official FIFA bracket: W{matchNum} references R32 match winners.
-        r16_matches = [
-            {"matchNumber": 89,  "date": "2026-07-04", "time": "13:00", "venueId": "nrg",               "home": "W74", "away": "W77"},
-            {"matchNumber": 90,  "date": "2026-07-04", "time": "17:00", "venueId": "lincoln_financial",  "home": "W73", "away": "W75"},
-            {"matchNumber": 91,  "date": "2026-07-05", "time": "16:00", "venueId": "metlife",            "home": "W76", "away": "W78"},
-            {"matchNumber": 92,  "date": "2026-07-05", "time": "20:00", "venueId": "azteca",             "home": "W79", "away": "W80"},
-            {"matchNumber": 93,  "date": "2026-07-06", "time": "15:00", "venueId": "att",                "home": "W83", "away": "W84"},
-            {"matchNumber": 94,  "date": "2026-07-06", "time": "20:00", "venueId": "lumen",              "home": "W81", "away": "W82"},
-            {"matchNumber": 95,  "date": "2026-07-07", "time": "12:00", "venueId": "mercedes_benz",      "home": "W86", "away": "W88"},
-            {"matchNumber": 96,  "date": "2026-07-07", "time": "16:00", "venueId": "bc_place",           "home": "W85", "away": "W87"},
-        ]
-
-        for m in r16_matches:
-            matches.append({
-                "matchNumber": m["matchNumber"],
-                "date": m["date"],
-                "time": m["time"],
-                "venueId": m["venueId"],
-                "round": "round_of_16",
-                "homePlaceholder": m["home"],
-                "awayPlaceholder": m["away"],
-            })
-
+        ("round_of_16", (
+            (89,  "2026-07-04", "13:00", "nrg",               "W74", "W77"),
+            (90,  "2026-07-04", "17:00", "lincoln_financial", "W73", "W75"),
+            (91,  "2026-07-05", "16:00", "metlife",           "W76", "W78"),
+            (92,  "2026-07-05", "20:00", "azteca",            "W79", "W80"),
+            (93,  "2026-07-06", "15:00", "att",               "W83", "W84"),
+            (94,  "2026-07-06", "20:00", "lumen",             "W81", "W82"),
+            (95,  "2026-07-07", "12:00", "mercedes_benz",     "W86", "W88"),
+            (96,  "2026-07-07", "16:00", "bc_place",          "W85", "W87"),
+        )),
         # Quarter-finals - July 10-11, 2026
-        # Pairings from official FIFA bracket.
-        qf_matches = [
-            {"matchNumber": 97,  "date": "2026-07-10", "time": "16:00", "venueId": "metlife",    "home": "W89", "away": "W90"},
-            {"matchNumber": 98,  "date": "2026-07-10", "time": "12:00", "venueId": "sofi",       "home": "W93", "away": "W94"},
-            {"matchNumber": 99,  "date": "2026-07-11", "time": "16:00", "venueId": "hard_rock",  "home": "W91", "away": "W92"},
-            {"matchNumber": 100, "date": "2026-07-11", "time": "20:00", "venueId": "arrowhead",  "home": "W95", "away": "W96"},
-        ]
-
-        for m in qf_matches:
-            matches.append({
-                "matchNumber": m["matchNumber"],
-                "date": m["date"],
-                "time": m["time"],
-                "venueId": m["venueId"],
-                "round": "quarter_finals",
-                "homePlaceholder": m["home"],
-                "awayPlaceholder": m["away"],
-            })
-
+        ("quarter_finals", (
+            (97,  "2026-07-10", "16:00", "metlife",   "W89", "W90"),
+            (98,  "2026-07-10", "12:00", "sofi",      "W93", "W94"),
+            (99,  "2026-07-11", "16:00", "hard_rock", "W91", "W92"),
+            (100, "2026-07-11", "20:00", "arrowhead", "W95", "W96"),
+        )),
         # Semi-finals - July 14-15, 2026
-        matches.append({
-            "matchNumber": 101,
-            "date": "2026-07-14",
-            "time": "20:00",
-            "venueId": "att",
-            "round": "semi_finals",
-            "homePlaceholder": "W97",
-            "awayPlaceholder": "W98",
-        })
-        matches.append({
-            "matchNumber": 102,
-            "date": "2026-07-15",
-            "time": "20:00",
-            "venueId": "mercedes_benz",
-            "round": "semi_finals",
-            "homePlaceholder": "W99",
-            "awayPlaceholder": "W100",
-        })
-
+        ("semi_finals", (
+            (101, "2026-07-14", "20:00", "att",           "W97", "W98"),
+            (102, "2026-07-15", "20:00", "mercedes_benz", "W99", "W100"),
+        )),
         # Third place play-off - July 18, 2026
-        matches.append({
-            "matchNumber": 103,
-            "date": "2026-07-18",
-            "time": "16:00",
-            "venueId": "hard_rock",
-            "round": "third_place",
-            "homePlaceholder": "L101",
-            "awayPlaceholder": "L102",
-        })
-
+        ("third_place", (
+            (103, "2026-07-18", "16:00", "hard_rock", "L101", "L102"),
+        )),
         # Final - July 19, 2026
-        matches.append({
-            "matchNumber": 104,
-            "date": "2026-07-19",
-            "time": "16:00",
-            "venueId": "metlife",
-            "round": "final",
-            "homePlaceholder": "W101",
-            "awayPlaceholder": "W102",
-        })
-
-        return matches
+        ("final", (
+            (104, "2026-07-19", "16:00", "metlife", "W101", "W102"),
+        )),
+    )
+
+    # Output-shaped knockout rows, built once at class load with the
+    # repeated strings interned like the group-stage templates
+    _KNOCKOUT_TEMPLATES = tuple(
+        {
+            "matchNumber": number,
+            "date": sys.intern(date),
+            "time": sys.intern(time),
+            "venueId": sys.intern(venue_id),
+            "round": round_type,
+            "homePlaceholder": sys.intern(home),
+            "awayPlaceholder": sys.intern(away),
+        }
+        for round_type, rows in _KNOCKOUT_SPECS
+        for number, date, time, venue_id, home, away in rows
+    )
+
+    def _generate_knockout_schedule(self, start_match_number: int) -> list[dict[str, Any]]:
+        """Generate knockout stage schedule.
+
+        The fixtures are expanded from the parameterized _KNOCKOUT_SPECS
+        table once at class load; this only copies the templates.
+
+        Args:
+            start_match_number: Starting match number for knockout stage.
+        """
+        return [dict(template) for template in self._KNOCKOUT_TEMPLATES]
 
     def _resolve_team_id(self, team_name: str) -> int | None:
         """Resolve a team name to its ID.
@@ -500,7 +622,12 @@ class ScheduleScraper(BaseScraper):
         """
         if not team_name or team_name == "TBD":
             return None
-        return self.team_name_to_id.get(team_name.lower())
+        cache = self._resolve_cache
+        if team_name in cache:
+            return cache[team_name]
+        result = self.team_name_to_id.get(team_name.lower())
+        cache[team_name] = result
+        return result
 
     def _normalize_venue(self, venue_name: str) -> str:
         """Normalize a venue name to our venue ID.
@@ -511,23 +638,12 @@ class ScheduleScraper(BaseScraper):
         Returns:
             Normalized venue ID.
         """
-        # Try exact match first
-        if venue_name in self.VENUE_ID_MAP:
-            return self.VENUE_ID_MAP[venue_name]
-
-        # Try case-insensitive match
-        venue_lower = venue_name.lower()
-        for name, venue_id in self.VENUE_ID_MAP.items():
-            if name.lower() == venue_lower:
-                return venue_id
-
-        # Try partial match
-        for name, venue_id in self.VENUE_ID_MAP.items():
-            if name.lower() in venue_lower or venue_lower in name.lower():
-                return venue_id
+        venue_id = _canonical_venue(venue_name)
+        if venue_id is not None:
+            return venue_id
 
-        self.logger.warning(f"Unknown venue: {venue_name}")
-        return venue_name.lower().replace(" ", "_")
+        self.logger.warning("Unknown venue: %s", venue_name)
+        return _slugify(venue_name)
 
     def _normalize_round(self, round_name: str) -> str:
         """Normalize a round name to our round type.
@@ -540,13 +656,9 @@ class ScheduleScraper(BaseScraper):
         """
         round_lower = round_name.lower().strip()
 
-        if round_lower in self.ROUND_MAP:
-            return self.ROUND_MAP[round_lower]
-
-        # Try partial match
-        for pattern, round_type in self.ROUND_MAP.items():
-            if pattern in round_lower:
-                return round_type
+        round_type = _canonical_round(round_lower)
+        if round_type is not None:
+            return round_type
 
-        self.logger.warning(f"Unknown round: {round_name}")
-        return round_lower.replace(" ", "_")
+        self.logger.warning("Unknown round: %s", round_name)
+        return _slugify(round_lower)
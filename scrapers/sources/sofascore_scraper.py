@@ -1,13 +1,15 @@
 """Sofascore form ratings scraper."""
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import cloudscraper
-
 from .base import BaseScraper
+from ..utils import jsonio
+from ..utils.http import create_cloudscraper_session
 
 
 class SofascoreScraper(BaseScraper):
@@ -20,25 +22,44 @@ class SofascoreScraper(BaseScraper):
     BASE_URL = "https://api.sofascore.com/api/v1"
     RATE_LIMIT_DELAY = 2.0  # seconds between requests
 
-    def __init__(self, output_dir: Path, team_ids: dict[str, int] | None = None) -> None:
+    def __init__(
+        self,
+        output_dir: Path,
+        team_ids: dict[str, int] | None = None,
+        max_workers: int = 1,
+        use_cache: bool = True,
+    ) -> None:
         """Initialize the Sofascore scraper.
 
         Args:
             output_dir: Directory where output files will be saved.
             team_ids: Optional dict mapping canonical team names to Sofascore IDs.
+            max_workers: Number of threads used to fetch teams concurrently.
+                The shared limiter keeps request starts RATE_LIMIT_DELAY
+                apart regardless of this; extra threads overlap response
+                latency and parsing, not the request rate.
+            use_cache: Whether to back the session with the on-disk
+                response cache. Disable to force fresh fetches.
         """
         super().__init__(output_dir)
         # Sofascore's API now blocks plain requests with 403. Use cloudscraper
-        # to bypass the bot protection (same approach as the Transfermarkt scraper).
-        self.session = cloudscraper.create_scraper(
-            browser={
-                "browser": "chrome",
-                "platform": "darwin",
-                "desktop": True,
-            }
+        # to bypass the bot protection (same approach as the Transfermarkt
+        # scraper). Responses are cached on disk, so re-runs within the cache
+        # TTL skip both the network round trip and the rate-limit delay.
+        self.session = create_cloudscraper_session(
+            cache_path=self.output_dir / ".http_cache" if use_cache else None
         )
         self.team_ids = team_ids or {}
-        self._last_request_time = 0.0
+        self.max_workers = max_workers
+        # Shared across all workers and NOT divided by the worker count:
+        # the aggregate request rate stays at one per RATE_LIMIT_DELAY
+        # no matter how many threads overlap their waits.
+        self.min_interval = self.RATE_LIMIT_DELAY
+        self._base_interval = self.min_interval
+        self.cache_hits = 0
+        self._rate_lock = threading.Lock()
+        # Monotonic timestamp: immune to wall-clock jumps (NTP, DST)
+        self._last_request_monotonic = 0.0
 
     def get_output_filename(self) -> str:
         """Get the output filename for this scraper.
@@ -48,12 +69,48 @@ class SofascoreScraper(BaseScraper):
         """
         return "sofascore_form.json"
 
-    def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - elapsed)
-        self._last_request_time = time.time()
+    def _rate_limit(self) -> float:
+        """Block until the shared inter-request interval has elapsed.
+
+        Thread-safe: the lock serializes waiters so request starts stay
+        min_interval apart across worker threads. Cache hits roll the
+        window back (see _scrape_team_form), so runs served from the
+        response cache don't sleep at all.
+
+        Returns:
+            The timestamp stamped for this request, so the cache-hit
+            refund can compare-and-reset it without clobbering a newer
+            stamp written by another worker in the meantime.
+        """
+        with self._rate_lock:
+            elapsed = time.monotonic() - self._last_request_monotonic
+            if elapsed < self.min_interval:
+                time.sleep(self.min_interval - elapsed)
+            stamp = time.monotonic()
+            self._last_request_monotonic = stamp
+            return stamp
+
+    def _note_response(self, status_code: int) -> None:
+        """Adapt the inter-request interval to server feedback (AIMD).
+
+        Throttling responses double the interval (the mounted retry
+        adapter has already honored Retry-After by the time the final
+        response surfaces here); successful ones decay it back toward
+        the configured base, so sustained runs settle near the rate the
+        API actually tolerates.
+
+        Args:
+            status_code: HTTP status code of the (non-cached) response.
+        """
+        with self._rate_lock:
+            if status_code in (429, 503):
+                self.min_interval = min(
+                    self.RATE_LIMIT_DELAY * 8, self.min_interval * 2.0
+                )
+            elif status_code < 400:
+                self.min_interval = max(
+                    self._base_interval, self.min_interval - 0.05
+                )
 
     def scrape(self, team_ids: dict[str, int] | None = None) -> dict[str, Any]:
         """Scrape form data for specified teams.
@@ -73,25 +130,54 @@ class SofascoreScraper(BaseScraper):
         if not teams_to_scrape:
             self.fail_fast("No team IDs provided to scrape")
 
-        self.logger.info(f"Scraping Sofascore form for {len(teams_to_scrape)} teams")
+        self.logger.info("Scraping Sofascore form for %d teams", len(teams_to_scrape))
 
         teams: dict[str, float] = {}
         matches_data: dict[str, dict] = {}
 
-        for team_name, sofascore_id in teams_to_scrape.items():
-            self._rate_limit()
-            form_score, match_info = self._scrape_team_form(team_name, sofascore_id)
-            if form_score is not None:
-                teams[team_name] = round(form_score, 2)
-                matches_data[team_name] = match_info
-                self.logger.info(f"  {team_name}: {form_score:.2f} (from {match_info['matches_used']} matches)")
-            else:
-                self.logger.warning(f"  {team_name}: No form data found")
+        # Warm DNS and the TLS session before the workers start, so the
+        # first real request doesn't pay connection setup inside its
+        # rate-limit slot; failures here are harmless.
+        try:
+            self.session.head(f"{self.BASE_URL}/", timeout=5)
+        except Exception:
+            pass
+
+        # Requests are network-bound and independent, so fetch teams in
+        # parallel; _rate_limit keeps the aggregate request rate unchanged.
+        # Size the pool to the pending work so a single-team run doesn't
+        # spin up (and tear down) idle workers.
+        workers = min(len(teams_to_scrape), self.max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._scrape_team_form, team_name, sofascore_id): team_name
+                for team_name, sofascore_id in teams_to_scrape.items()
+            }
+            for future in as_completed(futures):
+                team_name = futures[future]
+                form_score, match_info = future.result()
+                if form_score is not None:
+                    teams[team_name] = round(form_score, 2)
+                    matches_data[team_name] = match_info
+                    # Lazy %-formatting: skipped entirely when INFO is filtered
+                    self.logger.info(
+                        "  %s: %.2f (from %d matches)",
+                        team_name,
+                        form_score,
+                        match_info["matches_used"],
+                    )
+                else:
+                    self.logger.warning("  %s: No form data found", team_name)
+
+        # Futures complete in arbitrary order; restore mapping order so the
+        # output file stays stable across runs.
+        teams = {name: teams[name] for name in teams_to_scrape if name in teams}
+        matches_data = {name: matches_data[name] for name in teams}
 
         if not teams:
             self.fail_fast("No form data found for any team")
 
-        self.logger.info(f"Successfully scraped {len(teams)} team form scores")
+        self.logger.info("Successfully scraped %d team form scores", len(teams))
 
         return {
             "teams": teams,
@@ -111,6 +197,8 @@ class SofascoreScraper(BaseScraper):
             Tuple of (form_score, match_info) or (None, {}) if not found.
             Form score is average points per game (0.0 - 3.0).
         """
+        stamp = self._rate_limit()
+
         url = f"{self.BASE_URL}/team/{sofascore_id}/events/last/0"
 
         # Don't override the cloudscraper User-Agent; only add API-specific headers.
@@ -120,11 +208,26 @@ class SofascoreScraper(BaseScraper):
         }
 
         try:
-            response = self.session.get(url, headers=headers, timeout=30)
+            # (connect, read) timeouts so a hung socket can't stall the run
+            response = self.session.get(url, headers=headers, timeout=(3.05, 30))
+            if getattr(response, "from_cache", False):
+                # Cache hits (including 304-revalidated entries) consumed no
+                # network slot; hand it back so the next caller doesn't
+                # sleep. Compare-and-reset: only refund our own stamp — a
+                # newer one belongs to another worker's real request and
+                # zeroing it would let the next caller fire back-to-back.
+                with self._rate_lock:
+                    self.cache_hits += 1
+                    if self._last_request_monotonic == stamp:
+                        self._last_request_monotonic = 0.0
+            else:
+                self._note_response(response.status_code)
             response.raise_for_status()
-            data = response.json()
+            # Decode straight from the response bytes with orjson instead
+            # of response.json()'s stdlib pass over a decoded string
+            data = jsonio.loads(response.content)
         except Exception as e:
-            self.logger.error(f"Failed to fetch {team_name} (ID: {sofascore_id}): {e}")
+            self.logger.error("Failed to fetch %s (ID: %d): %s", team_name, sofascore_id, e)
             return None, {}
 
         return self._calculate_form(data, sofascore_id, team_name)
@@ -145,21 +248,29 @@ class SofascoreScraper(BaseScraper):
         """
         events = data.get("events", [])
         if not events:
-            self.logger.warning(f"No events found for {team_name}")
+            self.logger.warning("No events found for %s", team_name)
             return None, {}
 
-        points = []
-        results = []
+        wins = draws = losses = 0
+        total_points = 0
+        result_chars: list[str] = []
+
+        # Process the last 10 *completed* matches, tallying counts and
+        # points inline so the results aren't re-scanned afterwards.
+        # Walking the full list until 10 finished matches are found (and
+        # stopping there) means live or postponed fixtures no longer eat
+        # into the cap the way a flat events[:10] slice did.
+        finished = 0
+        for event in events:
+            if finished >= 10:
+                break
 
-        # Process last 10 completed matches
-        for event in events[:10]:
             # Skip if match not finished
             status = event.get("status", {})
             if status.get("type") != "finished":
                 continue
 
             home_team = event.get("homeTeam", {})
-            away_team = event.get("awayTeam", {})
             home_score_data = event.get("homeScore", {})
             away_score_data = event.get("awayScore", {})
 
@@ -170,40 +281,36 @@ class SofascoreScraper(BaseScraper):
             if home_score is None or away_score is None:
                 continue
 
-            is_home = home_team.get("id") == team_id
-
-            if is_home:
-                if home_score > away_score:
-                    points.append(3)
-                    results.append("W")
-                elif home_score == away_score:
-                    points.append(1)
-                    results.append("D")
-                else:
-                    points.append(0)
-                    results.append("L")
+            if home_team.get("id") == team_id:
+                diff = home_score - away_score
             else:
-                if away_score > home_score:
-                    points.append(3)
-                    results.append("W")
-                elif away_score == home_score:
-                    points.append(1)
-                    results.append("D")
-                else:
-                    points.append(0)
-                    results.append("L")
+                diff = away_score - home_score
+
+            finished += 1
+            if diff > 0:
+                wins += 1
+                total_points += 3
+                result_chars.append("W")
+            elif diff == 0:
+                draws += 1
+                total_points += 1
+                result_chars.append("D")
+            else:
+                losses += 1
+                result_chars.append("L")
 
-        if not points:
+        matches_used = wins + draws + losses
+        if not matches_used:
             return None, {}
 
-        form_score = sum(points) / len(points)
+        form_score = total_points / matches_used
         match_info = {
-            "matches_used": len(points),
-            "results": "".join(results),
-            "wins": results.count("W"),
-            "draws": results.count("D"),
-            "losses": results.count("L"),
-            "total_points": sum(points),
+            "matches_used": matches_used,
+            "results": "".join(result_chars),
+            "wins": wins,
+            "draws": draws,
+            "losses": losses,
+            "total_points": total_points,
         }
 
         return form_score, match_info
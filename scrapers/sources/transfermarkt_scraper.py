@@ -1,14 +1,48 @@
 """Transfermarkt market value scraper for national teams."""
 
 import re
+import threading
 import time
 from pathlib import Path
 from typing import Any
 
-import cloudscraper
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from scrapers.sources.base import BaseScraper, ScraperError
+from scrapers.utils.http import create_cloudscraper_session
+
+# Market-value probes compiled once at import; tree.xpath(...) would
+# re-parse the expression on every page
+_XP_VALUE_WRAPPER = etree.XPath(
+    "//a[contains(@class, 'data-header__market-value-wrapper')]"
+)
+_XP_VALUE_BOX = etree.XPath(
+    "//*[contains(@class, 'data-header__box--small')]"
+    "//*[contains(@class, 'data-header__content')]"
+)
+_XP_VALUE_SPAN = etree.XPath(
+    "//span[contains(@class, 'data-header__market-value')]"
+)
+
+# Matches values like "EUR1.54bn", "EUR795.00m", "EUR30.50k", "$1.54bn";
+# compiled once so the per-team parse skips the regex-cache lookup
+_VALUE_RE = re.compile(
+    r"[€$£]?\s*(\d+(?:\.\d+)?)\s*(bn|m|k|million|billion|thousand)?",
+    re.IGNORECASE,
+)
+
+# Suffix to millions multiplier, replacing the if/elif chain with one
+# dict probe; bare numbers are already in millions
+_SUFFIX_MULT = {
+    "bn": 1000.0,
+    "billion": 1000.0,
+    "m": 1.0,
+    "million": 1.0,
+    "": 1.0,
+    "k": 0.001,
+    "thousand": 0.001,
+}
 
 
 class TransfermarktScraper(BaseScraper):
@@ -17,20 +51,27 @@ class TransfermarktScraper(BaseScraper):
     BASE_URL = "https://www.transfermarkt.us"
     RATE_LIMIT_DELAY = 2.0  # seconds between requests
 
-    def __init__(self, output_dir: Path) -> None:
+    def __init__(
+        self, output_dir: Path, max_workers: int = 1, use_cache: bool = True
+    ) -> None:
         """Initialize the Transfermarkt scraper.
 
         Args:
             output_dir: Directory where output files will be saved.
+            max_workers: Number of threads that will call scrape_team()
+                concurrently. The shared limiter keeps request starts
+                RATE_LIMIT_DELAY apart regardless of this; extra threads
+                overlap response latency and parsing, not the request
+                rate.
+            use_cache: Whether to back the session with the on-disk
+                response cache. Disable to force fresh fetches.
         """
         super().__init__(output_dir)
-        # Use cloudscraper to bypass Cloudflare protection
-        self.session = cloudscraper.create_scraper(
-            browser={
-                "browser": "chrome",
-                "platform": "darwin",
-                "desktop": True,
-            }
+        # Use cloudscraper to bypass Cloudflare protection. Responses are
+        # cached on disk, so re-runs within the cache TTL skip both the
+        # network round trip and the rate-limit delay.
+        self.session = create_cloudscraper_session(
+            cache_path=self.output_dir / ".http_cache" if use_cache else None
         )
         self.session.headers.update(
             {
@@ -46,15 +87,76 @@ class TransfermarktScraper(BaseScraper):
                 "Cache-Control": "max-age=0",
             }
         )
-        self._last_request_time: float = 0.0
+        # Shared across all workers and NOT divided by the worker count:
+        # the aggregate request rate stays at one per RATE_LIMIT_DELAY
+        # no matter how many threads overlap their waits.
+        self.min_interval = self.RATE_LIMIT_DELAY
+        self._base_interval = self.min_interval
+        self.cache_hits = 0
+        self._rate_lock = threading.Lock()
+        # Monotonic timestamp: immune to wall-clock jumps (NTP, DST)
+        self._last_request_monotonic: float = 0.0
+        self._warm_lock = threading.Lock()
+        self._warmed = False
+
+    def _rate_limit(self) -> float:
+        """Block until the shared inter-request interval has elapsed.
+
+        Thread-safe: the lock serializes waiters so request starts stay
+        min_interval apart across worker threads. Cache hits roll the
+        window back (see _fetch_team_value), so runs served from the
+        response cache don't sleep at all.
+
+        Returns:
+            The timestamp stamped for this request, so the cache-hit
+            refund can compare-and-reset it without clobbering a newer
+            stamp written by another worker in the meantime.
+        """
+        with self._rate_lock:
+            elapsed = time.monotonic() - self._last_request_monotonic
+            if elapsed < self.min_interval:
+                time.sleep(self.min_interval - elapsed)
+            stamp = time.monotonic()
+            self._last_request_monotonic = stamp
+            return stamp
+
+    def _note_response(self, status_code: int) -> None:
+        """Adapt the inter-request interval to server feedback (AIMD).
+
+        Throttling responses double the interval (the mounted retry
+        adapter has already honored Retry-After by the time the final
+        response surfaces here); successful ones decay it back toward
+        the configured base, so sustained runs settle near the rate the
+        site actually tolerates.
 
-    def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - elapsed)
-        self._last_request_time = time.time()
+        Args:
+            status_code: HTTP status code of the (non-cached) response.
+        """
+        with self._rate_lock:
+            if status_code in (429, 503):
+                self.min_interval = min(
+                    self.RATE_LIMIT_DELAY * 8, self.min_interval * 2.0
+                )
+            elif status_code < 400:
+                self.min_interval = max(
+                    self._base_interval, self.min_interval - 0.05
+                )
+
+    def _warm_connection(self) -> None:
+        """Prime DNS and the TLS session before the first real request.
+
+        Runs once per scraper (thread-safe): a throwaway HEAD pays the
+        handshake up front so the first scrape_team call doesn't spend
+        its rate-limit slot on connection setup. Failures are harmless.
+        """
+        with self._warm_lock:
+            if self._warmed:
+                return
+            self._warmed = True
+        try:
+            self.session.head(f"{self.BASE_URL}/", timeout=5)
+        except Exception:
+            pass
 
     def _build_url(self, team_slug: str, team_id: int) -> str:
         """Build the URL for a team's page.
@@ -83,24 +185,26 @@ class TransfermarktScraper(BaseScraper):
         # Clean up the string - remove currency symbols and whitespace
         cleaned = value_str.strip().replace(",", ".")
 
-        # Match patterns like "EUR1.54bn", "EUR795.00m", "EUR30.50k", "$1.54bn"
-        pattern = r"[€$£]?\s*(\d+(?:\.\d+)?)\s*(bn|m|k|million|billion|thousand)?"
-        match = re.search(pattern, cleaned, re.IGNORECASE)
-
+        # Fast path: nearly every scraped value is "€795.00m"-shaped
+        # (currency prefix, number, m/bn/k suffix); parse that directly
+        # and leave the regex for exotic inputs
+        stripped = cleaned.lstrip("€$£EUR ")
+        try:
+            if stripped[-2:].lower() == "bn":
+                return float(stripped[:-2]) * 1000.0
+            last = stripped[-1]
+            if last in "mM":
+                return float(stripped[:-1])
+            if last in "kK":
+                return float(stripped[:-1]) * 0.001
+        except (ValueError, IndexError):
+            pass
+
+        match = _VALUE_RE.search(cleaned)
         if not match:
             self.fail_fast(f"Could not parse market value: {value_str}")
 
-        value = float(match.group(1))
-        suffix = (match.group(2) or "").lower()
-
-        if suffix in ("bn", "billion"):
-            return value * 1000.0  # Convert billions to millions
-        elif suffix in ("m", "million", ""):
-            return value  # Already in millions
-        elif suffix in ("k", "thousand"):
-            return value / 1000.0  # Convert thousands to millions
-        else:
-            self.fail_fast(f"Unrecognized value suffix in: {value_str}")
+        return float(match.group(1)) * _SUFFIX_MULT[(match.group(2) or "").lower()]
 
     def _fetch_team_value(self, team_slug: str, team_id: int) -> float:
         """Fetch the market value for a single team.
@@ -115,47 +219,61 @@ class TransfermarktScraper(BaseScraper):
         Raises:
             ScraperError: If the request fails or parsing fails.
         """
-        self._rate_limit()
+        stamp = self._rate_limit()
 
         url = self._build_url(team_slug, team_id)
-        self.logger.info(f"Fetching {url}")
+        self.logger.info("Fetching %s", url)
 
         try:
-            response = self.session.get(url, timeout=30)
+            # (connect, read) timeouts so a hung socket can't stall the run
+            response = self.session.get(url, timeout=(3.05, 30))
         except Exception as e:
             self.fail_fast(f"Request failed for {team_slug}: {e}")
 
+        if getattr(response, "from_cache", False):
+            # Cache hits (including 304-revalidated entries) consumed no
+            # network slot; hand it back so the next caller doesn't
+            # sleep. Compare-and-reset: only refund our own stamp — a
+            # newer one belongs to another worker's real request and
+            # zeroing it would let the next caller fire back-to-back.
+            with self._rate_lock:
+                self.cache_hits += 1
+                if self._last_request_monotonic == stamp:
+                    self._last_request_monotonic = 0.0
+        else:
+            self._note_response(response.status_code)
+
         if response.status_code != 200:
             self.fail_fast(
                 f"HTTP {response.status_code} for {team_slug} ({url})"
             )
 
-        soup = BeautifulSoup(response.text, "lxml")
+        # Parse with lxml directly from the response bytes: no BeautifulSoup
+        # tree-wrapping overhead and no separate decode step
+        tree = lxml_html.fromstring(response.content)
 
         # The total market value is in the header section
         # Look for the data-market-value attribute or the market value display
-        value_element = soup.select_one(
-            "a.data-header__market-value-wrapper"
-        )
-
-        if value_element:
+        elements = _XP_VALUE_WRAPPER(tree)
+        if elements:
             # Extract text and parse - format is usually "€795.00m"
-            value_text = value_element.get_text(strip=True)
-            self.logger.debug(f"Found market value text: {value_text}")
+            value_text = elements[0].text_content().strip()
+            # Lazy %-formatting: debug is filtered on normal runs
+            self.logger.debug("Found market value text: %s", value_text)
             return self._parse_market_value(value_text)
 
         # Alternative selector - look in the box with "Total market value"
-        value_box = soup.select_one(".data-header__box--small .data-header__content")
-        if value_box:
-            value_text = value_box.get_text(strip=True)
-            self.logger.debug(f"Found market value in box: {value_text}")
+        elements = _XP_VALUE_BOX(tree)
+        if elements:
+            value_text = elements[0].text_content().strip()
+            self.logger.debug("Found market value in box: %s", value_text)
             return self._parse_market_value(value_text)
 
         # Try another common pattern
-        market_value_span = soup.select_one("span.data-header__market-value")
-        if market_value_span:
-            value_text = market_value_span.get_text(strip=True)
-            self.logger.debug(f"Found market value span: {value_text}")
+        elements = _XP_VALUE_SPAN(tree)
+        if elements:
+            value_text = elements[0].text_content().strip()
+            self.logger.debug("Found market value span: %s", value_text)
             return self._parse_market_value(value_text)
 
         self.fail_fast(
@@ -177,8 +295,9 @@ class TransfermarktScraper(BaseScraper):
         Raises:
             ScraperError: If scraping fails.
         """
+        self._warm_connection()
         value = self._fetch_team_value(team_slug, team_id)
-        self.logger.info(f"{canonical_name}: {value:.2f}m")
+        self.logger.info("%s: %.2fm", canonical_name, value)
         return canonical_name, value
 
     def scrape(self) -> Any:
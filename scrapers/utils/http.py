@@ -1,21 +1,202 @@
 """HTTP utilities for scrapers."""
 
+import random
+import threading
 import time
+from datetime import timedelta
 from functools import wraps
+from pathlib import Path
 from typing import Any, Callable
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from scrapers.config.settings import USER_AGENT, TIMEOUT, RATE_LIMIT_DELAY
 
+try:
+    from requests_cache import CacheMixin
+except ImportError:  # requests-cache is optional; sessions fall back to uncached
+    CacheMixin = None
 
-def create_session() -> requests.Session:
+
+# Browser fingerprint used for all cloudscraper sessions.
+CLOUDSCRAPER_BROWSER = {
+    "browser": "chrome",
+    "platform": "darwin",
+    "desktop": True,
+}
+
+
+# Built lazily by _get_cached_scraper_cls so importing this module doesn't
+# pay for cloudscraper.
+_cached_scraper_cls: type | None = None
+
+
+def _get_cached_scraper_cls() -> type:
+    """Build (once) the CacheMixin-over-CloudScraper session class."""
+    global _cached_scraper_cls
+    if _cached_scraper_cls is None:
+        import cloudscraper
+
+        class _CachedCloudScraper(CacheMixin, cloudscraper.CloudScraper):
+            """CloudScraper with a persistent SQLite response cache.
+
+            requests-cache filters unrecognized kwargs before they reach
+            CloudScraper, so the browser fingerprint is re-applied after
+            construction instead of being passed through.
+            """
+
+            def __init__(
+                self, *args: Any, browser: dict | None = None, **kwargs: Any
+            ) -> None:
+                super().__init__(*args, **kwargs)
+                if browser is not None:
+                    from cloudscraper import CipherSuiteAdapter
+                    from cloudscraper.user_agent import User_Agent
+
+                    self.user_agent = User_Agent(
+                        allow_brotli=self.allow_brotli, browser=browser
+                    )
+                    self.headers = self.user_agent.headers
+                    cipher_suite = self.user_agent.cipherSuite
+                    if isinstance(cipher_suite, list):
+                        cipher_suite = ":".join(cipher_suite)
+                    self.cipherSuite = cipher_suite
+                    self.mount(
+                        "https://",
+                        CipherSuiteAdapter(
+                            cipherSuite=cipher_suite,
+                            ecdhCurve=self.ecdhCurve,
+                            server_hostname=self.server_hostname,
+                            source_address=self.source_address,
+                            ssl_context=self.ssl_context,
+                        ),
+                    )
+
+        _cached_scraper_cls = _CachedCloudScraper
+    return _cached_scraper_cls
+
+
+def create_cloudscraper_session(
+    cache_path: Path | None = None,
+    expire_after_hours: float = 12.0,
+) -> requests.Session:
+    """Create a cloudscraper session, optionally backed by an on-disk cache.
+
+    Args:
+        cache_path: Base path for a SQLite response cache. When set (and
+            requests-cache is installed), successful responses are reused
+            across runs until they expire; cached responses carry a
+            ``from_cache`` attribute so callers can skip rate-limit delays.
+        expire_after_hours: Cache TTL in hours.
+
+    Returns:
+        A configured cloudscraper session.
+    """
+    import cloudscraper
+
+    if cache_path is not None and CacheMixin is not None:
+        session = _get_cached_scraper_cls()(
+            cache_name=str(cache_path),
+            backend="sqlite",
+            expire_after=timedelta(hours=expire_after_hours),
+            allowable_codes=(200,),
+            browser=CLOUDSCRAPER_BROWSER,
+        )
+    else:
+        session = cloudscraper.create_scraper(browser=dict(CLOUDSCRAPER_BROWSER))
+
+    # Widen the connection pool and retry transient failures. The https
+    # adapter is rebuilt as a CipherSuiteAdapter (with the session's existing
+    # TLS settings) because a plain HTTPAdapter would lose the cloudscraper
+    # TLS fingerprint.
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+    session.mount(
+        "https://",
+        cloudscraper.CipherSuiteAdapter(
+            cipherSuite=session.cipherSuite,
+            ecdhCurve=session.ecdhCurve,
+            server_hostname=session.server_hostname,
+            source_address=session.source_address,
+            ssl_context=session.ssl_context,
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=retries,
+        ),
+    )
+    session.mount(
+        "http://",
+        HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries),
+    )
+
+    return session
+
+
+# Process-wide adapter shared by every plain session. urllib3's
+# connection pools are thread-safe, so warm keep-alive connections
+# survive across scraper instances while each session keeps its own
+# cookies and headers (plain requests.Session makes no thread-safety
+# guarantees, so whole sessions are never shared). Cloudscraper
+# sessions build their own adapters: their TLS fingerprints differ.
+_shared_adapter: HTTPAdapter | None = None
+_shared_adapter_lock = threading.Lock()
+
+
+def _get_shared_adapter() -> HTTPAdapter:
+    """Build (once) the pooled, retrying adapter plain sessions share."""
+    global _shared_adapter
+    with _shared_adapter_lock:
+        if _shared_adapter is None:
+            retries = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("GET",),
+            )
+            _shared_adapter = HTTPAdapter(
+                pool_connections=16, pool_maxsize=32, max_retries=retries
+            )
+        return _shared_adapter
+
+
+def create_session(
+    cache_path: Path | None = None,
+    expire_after_hours: float = 24.0,
+) -> requests.Session:
     """Create a requests Session with default headers.
 
+    Every session returned here mounts one process-shared connection
+    adapter, so warm keep-alive connections carry over between scraper
+    instances even though each caller gets its own session object.
+
+    Args:
+        cache_path: Base path for a SQLite response cache. When set (and
+            requests-cache is installed), successful responses are reused
+            across runs until they expire; cached responses carry a
+            ``from_cache`` attribute so callers can skip rate-limit delays.
+        expire_after_hours: Cache TTL in hours.
+
     Returns:
         A configured requests.Session instance.
     """
-    session = requests.Session()
+    if cache_path is not None and CacheMixin is not None:
+        from requests_cache import CachedSession
+
+        session: requests.Session = CachedSession(
+            cache_name=str(cache_path),
+            backend="sqlite",
+            expire_after=timedelta(hours=expire_after_hours),
+            allowable_codes=(200,),
+            stale_if_error=True,
+        )
+    else:
+        session = requests.Session()
     session.headers.update(
         {
             "User-Agent": USER_AGENT,
@@ -26,28 +207,74 @@ def create_session() -> requests.Session:
             "Upgrade-Insecure-Requests": "1",
         }
     )
+
+    # Mount the process-shared adapter: keep-alive connections are
+    # pooled across sessions (and scraper instances) instead of being
+    # re-handshaken per session, and transient failures are retried.
+    adapter = _get_shared_adapter()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
     return session
 
 
 class RateLimiter:
-    """Simple rate limiter for HTTP requests."""
+    """Rate limiter for HTTP requests with AIMD backpressure.
+
+    The delay between requests adapts to server feedback reported via
+    report(): successful responses additively shrink it back toward the
+    configured minimum, while 429/503 responses multiplicatively grow it
+    (and honor ``Retry-After``), so sustained use converges near the
+    rate the server actually tolerates instead of hammering through
+    throttling.
+    """
 
-    def __init__(self, delay: float = RATE_LIMIT_DELAY) -> None:
+    def __init__(
+        self,
+        delay: float = RATE_LIMIT_DELAY,
+        max_delay: float = 30.0,
+    ) -> None:
         """Initialize the rate limiter.
 
         Args:
-            delay: Minimum seconds between requests.
+            delay: Minimum seconds between requests; also the floor the
+                adaptive delay decays back to after backoff.
+            max_delay: Upper bound on the adaptive delay.
         """
+        self.min_delay = delay
+        self.max_delay = max_delay
         self.delay = delay
-        self._last_request_time: float = 0.0
+        # Monotonic timestamp: immune to wall-clock jumps (NTP, DST)
+        # that could otherwise skip or absurdly stretch the wait
+        self._last_request_monotonic: float = 0.0
 
     def wait(self) -> None:
         """Wait if necessary to respect rate limit."""
-        now = time.time()
-        elapsed = now - self._last_request_time
+        elapsed = time.monotonic() - self._last_request_monotonic
         if elapsed < self.delay:
             time.sleep(self.delay - elapsed)
-        self._last_request_time = time.time()
+        self._last_request_monotonic = time.monotonic()
+
+    def report(self, status_code: int, headers: Any = None) -> None:
+        """Adapt the delay to the outcome of a request (AIMD).
+
+        Args:
+            status_code: HTTP status code of the response.
+            headers: Optional response headers; ``Retry-After`` is
+                honored (numeric form) on throttling responses.
+        """
+        if status_code in (429, 503):
+            retry_after = 0.0
+            if headers is not None:
+                try:
+                    retry_after = float(headers.get("Retry-After", 0))
+                except (TypeError, ValueError):
+                    retry_after = 0.0
+            if retry_after > 0:
+                time.sleep(min(retry_after, self.max_delay))
+            self.delay = min(self.max_delay, self.delay * 2.0)
+        elif status_code < 400:
+            self.delay = max(self.min_delay, self.delay - 0.05)
 
     def __call__(self, func: Callable[..., Any]) -> Callable[..., Any]:
         """Decorator to rate limit a function.
@@ -81,3 +308,39 @@ def rate_limited(func: Callable[..., Any]) -> Callable[..., Any]:
         Wrapped function with rate limiting.
     """
     return rate_limiter(func)
+
+
+def get_with_backoff(
+    session: requests.Session,
+    url: str,
+    limiter: RateLimiter | None = None,
+    max_attempts: int = 3,
+    **kwargs: Any,
+) -> requests.Response:
+    """GET through a rate limiter, retrying throttled responses.
+
+    Each attempt waits for the limiter's slot and reports the outcome
+    back to it; 429/503 responses are retried with jittered exponential
+    backoff on top of the limiter's (already increased) delay.
+
+    Args:
+        session: Session to issue the request on.
+        limiter: Rate limiter to use; defaults to the global instance.
+        max_attempts: Maximum number of attempts before returning the
+            last throttled response as-is.
+        **kwargs: Passed through to ``session.get``.
+
+    Returns:
+        The first non-throttled response, or the final attempt's
+        response if every attempt was throttled.
+    """
+    if limiter is None:
+        limiter = rate_limiter
+    for attempt in range(max_attempts):
+        limiter.wait()
+        response = session.get(url, **kwargs)
+        limiter.report(response.status_code, response.headers)
+        if response.status_code not in (429, 503) or attempt == max_attempts - 1:
+            break
+        time.sleep(limiter.delay * 2**attempt + random.uniform(0.0, 0.5))
+    return response
@@ -0,0 +1,60 @@
+"""JSON load/dump helpers backed by orjson when available.
+
+orjson parses and serializes considerably faster than the stdlib json
+module, which matters for the larger inputs (team_mapping.json, full
+rankings dumps) that get re-parsed on every CLI invocation. The stdlib
+fallback keeps the scrapers working in environments where orjson is not
+installed.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+if orjson is not None:
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any, *, pretty: bool = True) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes.
+
+        Args:
+            obj: The object to serialize.
+            pretty: Indent with 2 spaces when True, compact when False.
+
+        Returns:
+            The serialized JSON as bytes.
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
+
+    def dumps(obj: Any, *, pretty: bool = True) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes.
+
+        Args:
+            obj: The object to serialize.
+            pretty: Indent with 2 spaces when True, compact when False.
+
+        Returns:
+            The serialized JSON as bytes.
+        """
+        if pretty:
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
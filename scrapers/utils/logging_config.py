@@ -3,9 +3,6 @@
 import logging
 from typing import Optional
 
-from rich.console import Console
-from rich.logging import RichHandler
-
 
 def setup_logging(
     level: int = logging.INFO,
@@ -13,18 +10,32 @@ def setup_logging(
 ) -> None:
     """Configure logging with rich console output.
 
+    Idempotent: if the root logger already has handlers (an earlier
+    call, or an embedding application's own setup), it is left alone so
+    repeated subcommand invocations don't stack duplicate handlers.
+
     Args:
         level: Logging level (default: INFO).
         log_file: Optional path to log file.
     """
+    if logging.getLogger().handlers:
+        return
+
+    # Deferred: importing this module shouldn't pull in rich for callers
+    # that never configure logging
+    from rich.console import Console
+    from rich.logging import RichHandler
+
     console = Console(stderr=True)
 
+    # markup=False: no log call uses rich markup, so skipping the
+    # per-record markup parse keeps tight logging loops cheap
     handlers: list[logging.Handler] = [
         RichHandler(
             console=console,
             show_time=True,
             show_path=False,
-            markup=True,
+            markup=False,
             rich_tracebacks=True,
         )
     ]